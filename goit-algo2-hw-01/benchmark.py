@@ -0,0 +1,175 @@
+"""
+Performance benchmarks for homework 1 extensions.
+"""
+import heapq
+import random
+import sys
+import time
+
+from solution import find_min_max, quick_select, top_k
+from sliding_window import SlidingMinMax, SparseTable, SegmentTree
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def benchmark_sliding_window(n=20000, windows=(10, 100, 1000)):
+    """Sliding-window and range min/max vs repeated find_min_max calls."""
+    print("=== Sliding window min/max ===")
+    values = [random.randint(-10**6, 10**6) for _ in range(n)]
+
+    for window in windows:
+        def repeated():
+            return [find_min_max(values[i - window + 1:i + 1])
+                    for i in range(window - 1, n)]
+
+        def sliding():
+            tracker = SlidingMinMax(window)
+            result = []
+            for i, x in enumerate(values):
+                tracker.push(x)
+                if i >= window - 1:
+                    result.append(tracker.min_max())
+            return result
+
+        expected, naive_time = _timed(repeated)
+        got, deque_time = _timed(sliding)
+        assert got == expected
+        print(f"window={window:<6} find_min_max x{n - window + 1}: {naive_time:.4f}s   "
+              f"SlidingMinMax: {deque_time:.4f}s   speed-up: {naive_time / deque_time:.1f}x")
+
+    print("\n--- Arbitrary range queries (static array) ---")
+    queries = []
+    for _ in range(2000):
+        left = random.randrange(n)
+        queries.append((left, random.randrange(left, n)))
+    naive, naive_time = _timed(lambda: [find_min_max(values[l:r + 1]) for l, r in queries])
+    for name, cls in (("SparseTable", SparseTable), ("SegmentTree", SegmentTree)):
+        structure, build_time = _timed(cls, values)
+        got, query_time = _timed(lambda: [structure.query(l, r) for l, r in queries])
+        assert got == naive
+        print(f"{name:<12} build: {build_time:.4f}s   {len(queries)} queries: {query_time:.4f}s")
+    print(f"find_min_max {len(queries)} queries: {naive_time:.4f}s")
+
+
+def benchmark_top_k(n=200000, ks=(10, 100, 1000, 10000, 50000)):
+    """top_k vs sorted(arr)[:k] and heapq.nsmallest."""
+    print("\n=== top_k ===")
+    values = [random.random() for _ in range(n)]
+    print(f"{'k':>8} {'top_k':>10} {'sorted[:k]':>12} {'nsmallest':>12}")
+    for k in ks:
+        got, top_time = _timed(top_k, values, k)
+        expected, sort_time = _timed(lambda: sorted(values)[:k])
+        _, heap_time = _timed(heapq.nsmallest, k, values)
+        assert got == expected
+        print(f"{k:>8} {top_time:>9.4f}s {sort_time:>11.4f}s {heap_time:>11.4f}s")
+
+
+class _Counted:
+    """Number wrapper that counts comparisons made by selection algorithms."""
+    __slots__ = ("v",)
+    comparisons = 0
+
+    def __init__(self, v):
+        self.v = v
+
+    def __lt__(self, other):
+        _Counted.comparisons += 1
+        return self.v < other.v
+
+    def __eq__(self, other):
+        _Counted.comparisons += 1
+        return self.v == other.v
+
+
+class _CountingList(list):
+    """List that counts element writes; a swap is two writes."""
+    writes = 0
+
+    def __setitem__(self, index, value):
+        _CountingList.writes += 1
+        super().__setitem__(index, value)
+
+
+def _lomuto_select(a, k):
+    """Baseline: the original randomized Lomuto quick_select (in place, iterative)."""
+    target = k - 1
+    left, right = 0, len(a) - 1
+    while left < right:
+        pivot_idx = random.randint(left, right)
+        pivot = a[pivot_idx]
+        a[pivot_idx], a[right] = a[right], a[pivot_idx]
+        store = left
+        for i in range(left, right):
+            if a[i] < pivot:
+                a[i], a[store] = a[store], a[i]
+                store += 1
+        a[store], a[right] = a[right], a[store]
+        if store == target:
+            return a[store]
+        if target < store:
+            right = store - 1
+        else:
+            left = store + 1
+    return a[left]
+
+
+_SELECTORS = {
+    "lomuto": _lomuto_select,
+    "introselect": lambda a, k: quick_select(a, k, inplace=True),
+    "floyd_rivest": lambda a, k: quick_select(a, k, inplace=True, method="floyd_rivest"),
+}
+
+_DISTRIBUTIONS = {
+    "uniform": lambda n: [random.random() for _ in range(n)],
+    "sorted": lambda n: list(range(n)),
+    "reversed": lambda n: list(range(n, 0, -1)),
+    "all-equal": lambda n: [7] * n,
+    "few-unique": lambda n: [random.randrange(10) for _ in range(n)],
+}
+
+
+def benchmark_selection(sizes=(10**3, 10**4, 10**5, 10**6), count_limit=10**5,
+                        lomuto_duplicates_limit=10**4):
+    """
+    Lomuto baseline vs introselect vs Floyd-Rivest across sizes, input
+    distributions and k positions. Wall time is measured on plain lists;
+    comparisons and swaps (element writes / 2) on an instrumented copy,
+    only for n <= count_limit. Lomuto is O(n^2) on duplicate-heavy input,
+    so it is skipped there above lomuto_duplicates_limit.
+    """
+    print("\n=== Selection algorithms ===")
+    print(f"{'n':>9} {'distribution':<12} {'k':>9} {'method':<13} "
+          f"{'time':>10} {'comparisons':>13} {'swaps':>11}")
+    for n in sizes:
+        for dist, make in _DISTRIBUTIONS.items():
+            data = make(n)
+            expected = sorted(data)
+            for k in (1, n // 2 or 1, n - n // 100):
+                for method, select in _SELECTORS.items():
+                    if (method == "lomuto" and dist in ("all-equal", "few-unique")
+                            and n > lomuto_duplicates_limit):
+                        print(f"{n:>9} {dist:<12} {k:>9} {method:<13} {'O(n^2)':>10}")
+                        continue
+                    result, elapsed = _timed(select, data.copy(), k)
+                    assert result == expected[k - 1]
+                    comparisons = swaps = "-"
+                    if n <= count_limit:
+                        _Counted.comparisons = _CountingList.writes = 0
+                        select(_CountingList(_Counted(x) for x in data), k)
+                        comparisons = _Counted.comparisons
+                        swaps = _CountingList.writes // 2
+                    print(f"{n:>9} {dist:<12} {k:>9} {method:<13} {elapsed:>9.4f}s "
+                          f"{comparisons:>13} {swaps:>11}")
+
+
+if __name__ == "__main__":
+    random.seed(42)
+    benchmark_sliding_window()
+    benchmark_top_k()
+    # --full adds the 10^7 size to the selection suite (takes minutes)
+    full = "--full" in sys.argv
+    benchmark_selection(sizes=(10**3, 10**4, 10**5, 10**6) + ((10**7,) if full else ()))
@@ -0,0 +1,226 @@
+"""
+Multi-process find_min_max and quick_select for very large numeric arrays.
+
+The data is copied once into multiprocessing.shared_memory; workers attach
+to the block by name and read their chunk directly, so nothing but chunk
+bounds and small results is pickled between processes.
+"""
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from solution import find_min_max, quick_select
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: workers then scan their chunk with Python loops
+    np = None
+
+# Below this many elements process start-up costs more than it saves
+_MIN_PARALLEL = 1 << 18
+# Chunks per worker, so that uneven chunks still keep every process busy
+_CHUNKS_PER_WORKER = 4
+
+
+class SharedArray:
+    """
+    A flat array of int64 ('q') or float64 ('d') values in shared memory.
+    Use as a context manager; the block is unlinked on exit.
+    """
+
+    def __init__(self, data):
+        if np is not None and isinstance(data, np.ndarray):
+            fmt = "q" if data.dtype.kind in "iub" else "d"
+            if data.dtype == np.uint64 and data.size and data.max() > np.iinfo(np.int64).max:
+                raise ValueError("Values must fit a C int64 or double")
+            source = memoryview(np.ascontiguousarray(data.ravel(), dtype=fmt))
+        elif isinstance(data, array) and data.typecode in ("q", "d"):
+            fmt = data.typecode
+            source = memoryview(data)
+        else:
+            fmt = "q" if all(isinstance(x, int) for x in data) else "d"
+            try:
+                # ints mixed with floats are stored as doubles: only exact ones
+                if fmt == "d" and not all(float(x) == x for x in data if isinstance(x, int)):
+                    raise OverflowError
+                source = memoryview(array(fmt, data))
+            except (OverflowError, TypeError):
+                raise ValueError("Values must fit a C int64 or double") from None
+        self.format = fmt
+        self.n = len(source)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+        self._shm.buf[:source.nbytes] = source.cast("B")
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def view(self):
+        """Typed memoryview over the shared block (release it before close)."""
+        return self._shm.buf[:self.n * array(self.format).itemsize].cast(self.format)
+
+    def close(self):
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _chunk_bounds(n, workers):
+    count = min(n, workers * _CHUNKS_PER_WORKER)
+    step = -(-n // count)
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+def _attach(name, fmt, start, stop, func):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        itemsize = array(fmt).itemsize
+        view = shm.buf[start * itemsize:stop * itemsize].cast(fmt)
+        try:
+            return func(view)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _chunk_min_max(name, fmt, start, stop):
+    return _attach(name, fmt, start, stop, find_min_max)
+
+
+def _chunk_partition(name, fmt, start, stop, lo, hi):
+    """
+    Counts values below lo and collects values in [lo, hi] for one chunk.
+    lo/hi of None mean an open bound.
+    """
+    def scan(view):
+        if np is not None:
+            a = np.asarray(view)
+            mask = np.ones(len(a), dtype=bool)
+            below = 0
+            if lo is not None:
+                below = int(np.count_nonzero(a < lo))
+                mask &= a >= lo
+            if hi is not None:
+                mask &= a <= hi
+            return below, a[mask].tolist()
+        below = 0
+        candidates = []
+        for x in view:
+            if lo is not None and x < lo:
+                below += 1
+            elif hi is None or x <= hi:
+                candidates.append(x)
+        return below, candidates
+
+    return _attach(name, fmt, start, stop, scan)
+
+
+def parallel_find_min_max(arr, workers=None):
+    """
+    find_min_max over worker processes: per-chunk min/max on shared memory,
+    combined in the parent.
+    :param arr: list, array.array or NumPy array of numbers
+    :param workers: number of processes (default: os.cpu_count())
+    :return: tuple (min, max)
+    """
+    if len(arr) == 0:
+        raise ValueError("List must be non-empty")
+    if len(arr) < _MIN_PARALLEL:
+        return find_min_max(arr)
+    workers = workers or os.cpu_count() or 1
+    with SharedArray(arr) as shared, ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(_chunk_min_max, shared.name, shared.format, start, stop)
+                   for start, stop in _chunk_bounds(shared.n, workers)]
+        parts = [f.result() for f in futures]
+    return min(lo for lo, _ in parts), max(hi for _, hi in parts)
+
+
+def parallel_quick_select(arr, k, workers=None, sample_size=4096, seed=None):
+    """
+    k-th smallest element using workers to narrow the candidate range.
+
+    A random sample of the shared array gives two pivots that bracket
+    rank k with high probability; workers count the values below the lower
+    pivot and return only the values between the pivots, and the parent
+    finishes with quick_select on that small candidate list. If the bracket
+    misses rank k, the scan is repeated between the missed pivot and a new
+    one taken farther out on that side.
+    :param arr: list, array.array or NumPy array of numbers
+    :param k: 1-based index for the k-th smallest element
+    :param workers: number of processes (default: os.cpu_count())
+    :param sample_size: number of sampled values used to pick the pivots
+    :param seed: seed for the sampling RNG
+    :return: the k-th smallest element
+    """
+    n = len(arr)
+    if n == 0:
+        raise ValueError("List must be non-empty")
+    if not isinstance(k, int) or k < 1 or k > n:
+        raise ValueError("k must be between 1 and the length of the list")
+    if n < _MIN_PARALLEL:
+        return quick_select(list(arr), k)
+    workers = workers or os.cpu_count() or 1
+    rng = random.Random(seed)
+
+    with SharedArray(arr) as shared, ProcessPoolExecutor(workers) as pool:
+        view = shared.view()
+        try:
+            sample = sorted(view[rng.randrange(n)] for _ in range(min(sample_size, n)))
+        finally:
+            view.release()
+        s = len(sample)
+        # ~3 standard deviations of the sample rank of the k-th value
+        margin = 3 * int(s ** 0.5) + 1
+        pos = (k - 1) * s // n
+        lo = sample[pos - margin] if pos - margin >= 0 else None
+        hi = sample[pos + margin] if pos + margin < s else None
+        lo_margin = hi_margin = margin
+        bounds = _chunk_bounds(n, workers)
+
+        while True:
+            futures = [pool.submit(_chunk_partition, shared.name, shared.format,
+                                   start, stop, lo, hi)
+                       for start, stop in bounds]
+            below = 0
+            candidates = []
+            for f in futures:
+                count, values = f.result()
+                below += count
+                candidates.extend(values)
+            # on a miss the missed pivot becomes the opposite bound, and the
+            # new pivot is taken twice as far out in the sample
+            if k <= below:
+                hi = lo
+                lo_margin *= 2
+                lo = sample[pos - lo_margin] if pos - lo_margin >= 0 else None
+            elif k > below + len(candidates):
+                lo = hi
+                hi_margin *= 2
+                hi = sample[pos + hi_margin] if pos + hi_margin < s else None
+            else:
+                return quick_select(candidates, k - below, inplace=True)
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = random.Random(0)
+    data = array("d", (rng.random() for _ in range(2_000_000)))
+    for name, func in (("find_min_max", find_min_max),
+                       ("parallel_find_min_max", parallel_find_min_max)):
+        start = time.perf_counter()
+        result = func(data)
+        print(f"{name:<24} {result} in {time.perf_counter() - start:.3f}s")
+    k = len(data) // 2
+    start = time.perf_counter()
+    print(f"parallel_quick_select    {parallel_quick_select(data, k, seed=1):.6f} "
+          f"in {time.perf_counter() - start:.3f}s")
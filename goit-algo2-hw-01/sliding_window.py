@@ -0,0 +1,165 @@
+"""
+Range min/max structures for repeated queries that find_min_max would
+answer in O(n) every time:
+
+- SlidingMinMax: last-N window over a stream, amortized O(1) push/pop.
+- SparseTable: static array, O(n log n) build, O(1) arbitrary-range query.
+- SegmentTree: O(n) build, O(log n) range query and point update.
+"""
+from collections import deque
+
+
+class SlidingMinMax:
+    """
+    Min/max over the most recent `window` values using two monotonic deques.
+    The min deque keeps increasing values, the max deque decreasing ones;
+    each value enters and leaves each deque once.
+    """
+
+    def __init__(self, window):
+        if not isinstance(window, int) or window < 1:
+            raise ValueError("window must be a positive integer")
+        self.window = window
+        self._values = deque()
+        self._mins = deque()  # (index, value), values increasing
+        self._maxs = deque()  # (index, value), values decreasing
+        self._start = 0  # index of the oldest value in the window
+        self._next = 0  # index of the next pushed value
+
+    def __len__(self):
+        return len(self._values)
+
+    def push(self, value):
+        """Appends a value, evicting the oldest one once the window is full."""
+        if len(self._values) == self.window:
+            self.pop()
+        self._values.append(value)
+        while self._mins and not self._mins[-1][1] < value:
+            self._mins.pop()
+        self._mins.append((self._next, value))
+        while self._maxs and not value < self._maxs[-1][1]:
+            self._maxs.pop()
+        self._maxs.append((self._next, value))
+        self._next += 1
+
+    def extend(self, values):
+        for value in values:
+            self.push(value)
+
+    def pop(self):
+        """Removes and returns the oldest value in the window."""
+        if not self._values:
+            raise IndexError("pop from empty window")
+        if self._mins[0][0] == self._start:
+            self._mins.popleft()
+        if self._maxs[0][0] == self._start:
+            self._maxs.popleft()
+        self._start += 1
+        return self._values.popleft()
+
+    def min(self):
+        if not self._values:
+            raise ValueError("Window is empty")
+        return self._mins[0][1]
+
+    def max(self):
+        if not self._values:
+            raise ValueError("Window is empty")
+        return self._maxs[0][1]
+
+    def min_max(self):
+        """Same result as find_min_max(list(window)), in O(1)."""
+        return self.min(), self.max()
+
+
+class SparseTable:
+    """
+    Static range min/max: level j stores min/max of every block of 2**j
+    values, and a query combines two overlapping blocks.
+    """
+
+    def __init__(self, arr):
+        if len(arr) == 0:
+            raise ValueError("List must be non-empty")
+        self.n = len(arr)
+        self._mins = [list(arr)]
+        self._maxs = [list(arr)]
+        span = 1
+        while 2 * span <= self.n:
+            prev_min, prev_max = self._mins[-1], self._maxs[-1]
+            count = self.n - 2 * span + 1
+            self._mins.append([min(prev_min[i], prev_min[i + span]) for i in range(count)])
+            self._maxs.append([max(prev_max[i], prev_max[i + span]) for i in range(count)])
+            span *= 2
+
+    def query(self, left, right):
+        """
+        Min and max of arr[left..right] (inclusive) in O(1).
+        :return: tuple (min, max)
+        """
+        if not 0 <= left <= right < self.n:
+            raise IndexError("range out of bounds")
+        level = (right - left + 1).bit_length() - 1
+        other = right - (1 << level) + 1
+        mins, maxs = self._mins[level], self._maxs[level]
+        return min(mins[left], mins[other]), max(maxs[left], maxs[other])
+
+
+class SegmentTree:
+    """
+    Iterative (bottom-up) segment tree with min and max in every node;
+    supports point updates, unlike SparseTable.
+    """
+
+    def __init__(self, arr):
+        if len(arr) == 0:
+            raise ValueError("List must be non-empty")
+        self.n = n = len(arr)
+        self._mins = [None] * n + list(arr)
+        self._maxs = [None] * n + list(arr)
+        for i in range(n - 1, 0, -1):
+            self._pull(i)
+
+    def _pull(self, i):
+        mins, maxs = self._mins, self._maxs
+        mins[i] = min(mins[2 * i], mins[2 * i + 1])
+        maxs[i] = max(maxs[2 * i], maxs[2 * i + 1])
+
+    def update(self, index, value):
+        """Sets arr[index] = value in O(log n)."""
+        if not 0 <= index < self.n:
+            raise IndexError("index out of bounds")
+        i = index + self.n
+        self._mins[i] = self._maxs[i] = value
+        i //= 2
+        while i:
+            self._pull(i)
+            i //= 2
+
+    def query(self, left, right):
+        """
+        Min and max of arr[left..right] (inclusive) in O(log n).
+        :return: tuple (min, max)
+        """
+        if not 0 <= left <= right < self.n:
+            raise IndexError("range out of bounds")
+        lo = hi = None
+        left += self.n
+        right += self.n + 1
+        while left < right:
+            if left & 1:
+                lo, hi = self._combine(lo, hi, left)
+                left += 1
+            if right & 1:
+                right -= 1
+                lo, hi = self._combine(lo, hi, right)
+            left //= 2
+            right //= 2
+        return lo, hi
+
+    def _combine(self, lo, hi, node):
+        node_min, node_max = self._mins[node], self._maxs[node]
+        if lo is None:
+            return node_min, node_max
+        return min(lo, node_min), max(hi, node_max)
+
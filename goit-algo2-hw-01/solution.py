@@ -1,40 +1,233 @@
+import heapq
+import math
 import random
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: buffers are then scanned with the min/max builtins
+    np = None
+
+
+# Elements per chunk when scanning buffers: a chunk stays in cache
+# between its min and max reductions
+_CHUNK = 1 << 16
+
+
+def _min_max_pairs(arr):
+    """
+    Iterative pairwise min/max: each pair is ordered with one comparison
+    and then checked against the running min and max, ~3n/2 comparisons.
+    """
+    n = len(arr)
+    if n % 2:
+        lo = hi = arr[0]
+        start = 1
+    else:
+        lo, hi = (arr[0], arr[1]) if arr[0] < arr[1] else (arr[1], arr[0])
+        start = 2
+    it = islice(arr, start, None)
+    for a, b in zip(it, it):
+        if b < a:
+            a, b = b, a
+        if a < lo:
+            lo = a
+        if hi < b:
+            hi = b
+    return lo, hi
+
+
+def _min_max_buffer(data):
+    """
+    Chunked min/max over a flat NumPy array or a 1-D memoryview.
+    Each chunk is reduced with C-level loops (ndarray.min/max or the
+    min/max builtins), and the partial results are combined in Python.
+    """
+    lo = hi = None
+    for start in range(0, len(data), _CHUNK):
+        chunk = data[start:start + _CHUNK]
+        if np is not None:
+            c_lo, c_hi = chunk.min(), chunk.max()
+        else:
+            c_lo, c_hi = min(chunk), max(chunk)
+        if lo is None or c_lo < lo:
+            lo = c_lo
+        if hi is None or hi < c_hi:
+            hi = c_hi
+    if np is not None:
+        return lo.item(), hi.item()
+    return lo, hi
 
 
 def find_min_max(arr):
     """
-    Finds the minimum and maximum elements in a list using divide and conquer.
-    :param arr: list of numbers
+    Finds the minimum and maximum elements of a sequence.
+    Lists are scanned pairwise (~3n/2 comparisons, no recursion);
+    NumPy arrays and buffer-protocol objects (array.array, memoryview,
+    bytes, bytearray) are reduced chunk by chunk, vectorized when NumPy
+    is installed.
+    :param arr: list, NumPy array or buffer of numbers
     :return: tuple (min, max)
     """
-    if not isinstance(arr, list) or len(arr) == 0:
+    if isinstance(arr, list):
+        if len(arr) == 0:
+            raise ValueError("List must be non-empty")
+        return _min_max_pairs(arr)
+
+    if np is not None and isinstance(arr, np.ndarray):
+        data = arr.ravel()
+    else:
+        try:
+            view = memoryview(arr)
+        except TypeError:
+            raise ValueError("Input must be a list, NumPy array or buffer") from None
+        if view.ndim != 1:
+            view = view.cast("B").cast(view.format)
+        data = np.asarray(view) if np is not None else view
+    if len(data) == 0:
         raise ValueError("List must be non-empty")
+    return _min_max_buffer(data)
 
-    def helper(left, right):
-        # Base case: one element
-        if left == right:
-            return arr[left], arr[left]
-        # Base case: two elements
-        if right == left + 1:
-            if arr[left] < arr[right]:
-                return arr[left], arr[right]
-            else:
-                return arr[right], arr[left]
-        # Divide
-        mid = (left + right) // 2
-        minL, maxL = helper(left, mid)
-        minR, maxR = helper(mid + 1, right)
-        # Combine results
-        return (min(minL, minR), max(maxL, maxR))
-
-    return helper(0, len(arr) - 1)
-
-
-def quick_select(arr, k):
-    """
-    Finds the k-th smallest element in an unsorted list using Quick Select.
+
+# Ranges at or below this size are finished with insertion sort
+_SMALL_RANGE = 16
+
+
+def _insertion_sort(a, left, right):
+    for i in range(left + 1, right + 1):
+        x = a[i]
+        j = i - 1
+        while j >= left and x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+
+
+def _partition3(a, left, right, pivot):
+    """
+    Three-way (Dutch national flag) partition of a[left..right] around pivot.
+    :return: (lt, gt) so that a[left:lt] < pivot, a[lt:gt + 1] == pivot
+             and a[gt + 1:right + 1] > pivot
+    """
+    lt, i, gt = left, left, right
+    while i <= gt:
+        x = a[i]
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            a[gt], a[i] = x, a[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _median_of_medians(a, left, right):
+    """
+    Returns a pivot value from a[left..right] that is guaranteed to have
+    at least ~30% of the range on each side (BFPRT).
+    Group medians are gathered at the front of the range.
+    """
+    count = 0
+    for group in range(left, right + 1, 5):
+        end = min(group + 4, right)
+        _insertion_sort(a, group, end)
+        median = (group + end) // 2
+        dest = left + count
+        a[dest], a[median] = a[median], a[dest]
+        count += 1
+    mid = left + (count - 1) // 2
+    return _select(a, mid, left, left + count - 1, depth_limit=0)
+
+
+def _select(a, target, left, right, depth_limit):
+    """
+    Iterative introselect: rearranges a[left..right] so that a[target]
+    holds the value it would have in sorted order.
+    Uses random pivots until depth_limit partitions have been made,
+    then falls back to median-of-medians for a worst-case O(n) bound.
+    """
+    depth = 0
+    while right - left >= _SMALL_RANGE:
+        if depth < depth_limit:
+            pivot = a[random.randint(left, right)]
+        else:
+            pivot = _median_of_medians(a, left, right)
+        lt, gt = _partition3(a, left, right, pivot)
+        if target < lt:
+            right = lt - 1
+        elif target > gt:
+            left = gt + 1
+        else:
+            return a[target]
+        depth += 1
+    _insertion_sort(a, left, right)
+    return a[target]
+
+
+# Floyd-Rivest recurses on a sample only for ranges larger than this
+_FR_SAMPLE_RANGE = 600
+
+
+def _floyd_rivest(a, target, left, right):
+    """
+    Floyd-Rivest selection (SELECT, 1975): recursively selects in a small
+    sample around the expected position of the target to get a pivot that
+    is very close to it, then does one Hoare-style pass over the range.
+    About n + min(k, n - k) + o(n) comparisons on average.
+    """
+    while right > left:
+        if right - left > _FR_SAMPLE_RANGE:
+            n = right - left + 1
+            i = target - left + 1
+            z = math.log(n)
+            s = 0.5 * math.exp(2 * z / 3)
+            sd = 0.5 * math.sqrt(z * s * (n - s) / n) * (1 if 2 * i >= n else -1)
+            new_left = max(left, int(target - i * s / n + sd))
+            new_right = min(right, int(target + (n - i) * s / n + sd))
+            _floyd_rivest(a, target, new_left, new_right)
+        t = a[target]
+        i, j = left, right
+        a[left], a[target] = a[target], a[left]
+        if t < a[right]:
+            a[left], a[right] = a[right], a[left]
+        while i < j:
+            a[i], a[j] = a[j], a[i]
+            i += 1
+            j -= 1
+            while a[i] < t:
+                i += 1
+            while t < a[j]:
+                j -= 1
+        if a[left] == t:
+            a[left], a[j] = a[j], a[left]
+        else:
+            j += 1
+            a[j], a[right] = a[right], a[j]
+        if j <= target:
+            left = j + 1
+        if target <= j:
+            right = j - 1
+    return a[target]
+
+
+def quick_select(arr, k, inplace=False, method="introselect"):
+    """
+    Finds the k-th smallest element in an unsorted list.
+    method="introselect" (default): Quick Select with random pivots and
+    three-way partitioning that switches to median-of-medians once the
+    partition depth exceeds ~2*log2(n), so the worst case stays O(n).
+    method="floyd_rivest": sampling-based Floyd-Rivest selection, fewer
+    comparisons on average but no worst-case guarantee.
     :param arr: list of numbers
     :param k: 1-based index for the k-th smallest element
+    :param inplace: partition arr itself instead of a copy (saves O(n) memory,
+                    but leaves arr reordered)
+    :param method: "introselect" or "floyd_rivest"
     :return: the k-th smallest element
     """
     if not isinstance(arr, list) or len(arr) == 0:
@@ -42,37 +235,102 @@ def quick_select(arr, k):
     n = len(arr)
     if not isinstance(k, int) or k < 1 or k > n:
         raise ValueError("k must be between 1 and the length of the list")
+    if method not in ("introselect", "floyd_rivest"):
+        raise ValueError(f"Unknown selection method: {method}")
 
-    # work on a copy to avoid mutating original
-    a = arr.copy()
-    target = k - 1
-
-    def partition(left, right):
-        pivot_idx = random.randint(left, right)
-        pivot = a[pivot_idx]
-        # move pivot to end
-        a[pivot_idx], a[right] = a[right], a[pivot_idx]
-        store = left
-        for i in range(left, right):
-            if a[i] < pivot:
-                a[i], a[store] = a[store], a[i]
-                store += 1
-        # move pivot to its final place
-        a[store], a[right] = a[right], a[store]
-        return store
-
-    def select(left, right):
-        if left == right:
-            return a[left]
-        pivot_index = partition(left, right)
-        if pivot_index == target:
-            return a[pivot_index]
-        elif target < pivot_index:
-            return select(left, pivot_index - 1)
+    # work on a copy to avoid mutating original unless asked otherwise
+    a = arr if inplace else arr.copy()
+    if method == "floyd_rivest":
+        return _floyd_rivest(a, k - 1, 0, n - 1)
+    return _select(a, k - 1, 0, n - 1, depth_limit=2 * n.bit_length())
+
+
+def quick_select_many(arr, ks, inplace=False):
+    """
+    Finds several order statistics of the same list in one partitioning pass.
+    After each three-way partition only the segments that still contain
+    a requested rank are processed further, so the cost is about
+    O(n log m) for m distinct ranks instead of m separate O(n) selections.
+    :param arr: list of numbers
+    :param ks: iterable of 1-based ranks (duplicates and any order allowed)
+    :param inplace: partition arr itself instead of a copy
+    :return: list of the k-th smallest elements, in the order of ks
+    """
+    if not isinstance(arr, list) or len(arr) == 0:
+        raise ValueError("List must be non-empty")
+    n = len(arr)
+    ks = list(ks)
+    for k in ks:
+        if not isinstance(k, int) or k < 1 or k > n:
+            raise ValueError("k must be between 1 and the length of the list")
+
+    a = arr if inplace else arr.copy()
+    targets = sorted({k - 1 for k in ks})
+    depth_limit = 2 * n.bit_length()
+    # each entry: (left, right, first target index, past-last target index, depth)
+    stack = [(0, n - 1, 0, len(targets), 0)]
+    while stack:
+        left, right, lo, hi, depth = stack.pop()
+        if right - left < _SMALL_RANGE:
+            _insertion_sort(a, left, right)
+            continue
+        if depth < depth_limit:
+            pivot = a[random.randint(left, right)]
         else:
-            return select(pivot_index + 1, right)
+            pivot = _median_of_medians(a, left, right)
+        lt, gt = _partition3(a, left, right, pivot)
+        mid_lo = bisect_left(targets, lt, lo, hi)
+        mid_hi = bisect_right(targets, gt, mid_lo, hi)
+        if lo < mid_lo:
+            stack.append((left, lt - 1, lo, mid_lo, depth + 1))
+        if mid_hi < hi:
+            stack.append((gt + 1, right, mid_hi, hi, depth + 1))
+
+    return [a[k - 1] for k in ks]
+
+
+# top_k uses a bounded heap when k * _HEAP_RATIO <= n
+# (crossover measured with benchmark.benchmark_top_k)
+_HEAP_RATIO = 16
+
+
+def top_k(arr, k, key=None):
+    """
+    Returns the k smallest elements in sorted order, same as
+    sorted(arr, key=key)[:k] (stable), without sorting the whole input.
+    For lists the introselect partition isolates the k smallest and only
+    that prefix is sorted, O(n + k log k). When k is tiny relative to n,
+    or arr is an iterator, a bounded heap (heapq.nsmallest) is used instead,
+    O(n log k) time and O(k) memory.
+    :param arr: list or any iterable
+    :param k: number of elements to return
+    :param key: optional key function, as in sorted()
+    :return: list of the k smallest elements
+    """
+    if not isinstance(k, int) or k < 1:
+        raise ValueError("k must be a positive integer")
+    if not isinstance(arr, list):
+        return heapq.nsmallest(k, arr, key=key)
+    n = len(arr)
+    if n == 0:
+        raise ValueError("List must be non-empty")
+    if k > n:
+        raise ValueError("k must be between 1 and the length of the list")
+    if k * _HEAP_RATIO <= n:
+        return heapq.nsmallest(k, arr, key=key)
 
-    return select(0, n - 1)
+    if key is None:
+        a = arr.copy()
+        _select(a, k - 1, 0, n - 1, depth_limit=2 * n.bit_length())
+        prefix = a[:k]
+        prefix.sort()
+        return prefix
+    # (key, index) pairs keep ties in input order and never compare items
+    a = [(key(x), i) for i, x in enumerate(arr)]
+    _select(a, k - 1, 0, n - 1, depth_limit=2 * n.bit_length())
+    prefix = a[:k]
+    prefix.sort()
+    return [arr[i] for _, i in prefix]
 
 
 if __name__ == "__main__":
@@ -85,3 +343,5 @@ if __name__ == "__main__":
     k = 3
     kth_value = quick_select(sample, k)
     print(f"{k}-th smallest element: {kth_value}")
+    ranks = [1, 3, 6]
+    print(f"Order statistics {ranks}: {quick_select_many(sample, ranks)}")
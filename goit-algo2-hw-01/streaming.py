@@ -0,0 +1,240 @@
+"""
+Streaming counterparts of find_min_max and quick_select for data that does
+not fit in memory: exact running min/max and a mergeable KLL quantile sketch.
+"""
+import random
+from itertools import islice
+
+from solution import find_min_max
+
+# Number of values materialized at once while consuming an iterable
+DEFAULT_CHUNK = 1 << 16
+
+
+def iter_chunks(iterable, chunk_size=DEFAULT_CHUNK):
+    """
+    Splits any iterable into lists of at most chunk_size elements.
+    :param iterable: iterable of numbers
+    :param chunk_size: maximum chunk length
+    :return: generator of non-empty lists
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_numbers(path):
+    """
+    Lazily reads numbers from a text file (separated by whitespace or commas),
+    so stream_min_max(read_numbers(path)) works without loading the file.
+    :param path: path to the file
+    :return: generator of floats
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            for token in line.replace(",", " ").split():
+                yield float(token)
+
+
+def stream_min_max(iterable, chunk_size=DEFAULT_CHUNK):
+    """
+    Exact minimum and maximum of an iterable in O(chunk_size) memory.
+    :param iterable: iterable of numbers
+    :param chunk_size: maximum chunk length
+    :return: tuple (min, max)
+    """
+    lo = hi = None
+    for chunk in iter_chunks(iterable, chunk_size):
+        c_lo, c_hi = find_min_max(chunk)
+        if lo is None or c_lo < lo:
+            lo = c_lo
+        if hi is None or hi < c_hi:
+            hi = c_hi
+    if lo is None:
+        raise ValueError("Iterable must be non-empty")
+    return lo, hi
+
+
+class QuantileSketch:
+    """
+    KLL quantile sketch (Karnin, Lang, Liberty, 2016).
+
+    Values are kept in a stack of compactors; an item at level h stands for
+    2**h original values. When a level overflows it is sorted and every
+    other item (random offset) is promoted to the next level. Memory is
+    O(k), and a rank query is off by about 1.7 * n / k with high probability.
+    Two sketches built on different shards can be merged.
+    """
+
+    def __init__(self, k=200, seed=None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.n = 0
+        self.min = None
+        self.max = None
+        self._rng = random.Random(seed)
+        self._compactors = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def __len__(self):
+        return self.n
+
+    def _capacity(self, level):
+        depth = len(self._compactors) - level - 1
+        return int(self.k * (2 / 3) ** depth) + 2
+
+    def _grow(self):
+        self._compactors.append([])
+        self._max_size = sum(self._capacity(h) for h in range(len(self._compactors)))
+
+    def _compress(self):
+        while self._size >= self._max_size:
+            for level, items in enumerate(self._compactors):
+                if len(items) >= self._capacity(level):
+                    if level + 1 == len(self._compactors):
+                        self._grow()
+                    items.sort()
+                    # an odd leftover stays at this level
+                    keep = items.pop() if len(items) % 2 else None
+                    offset = self._rng.getrandbits(1)
+                    self._compactors[level + 1].extend(items[offset::2])
+                    items.clear()
+                    if keep is not None:
+                        items.append(keep)
+                    self._size = sum(len(c) for c in self._compactors)
+                    break
+
+    def update(self, value):
+        """Adds one value to the sketch."""
+        self.update_many((value,))
+
+    def update_many(self, values):
+        """Adds a batch (list or any iterable) of values to the sketch."""
+        for chunk in iter_chunks(values):
+            lo, hi = find_min_max(chunk)
+            if self.min is None or lo < self.min:
+                self.min = lo
+            if self.max is None or self.max < hi:
+                self.max = hi
+            self.n += len(chunk)
+            level0 = self._compactors[0]
+            for start in range(0, len(chunk), self.k):
+                part = chunk[start:start + self.k]
+                level0.extend(part)
+                self._size += len(part)
+                self._compress()
+                level0 = self._compactors[0]
+
+    def merge(self, other):
+        """
+        Merges another sketch into this one (e.g. built on another shard).
+        :return: self
+        """
+        if other.n == 0:
+            return self
+        while len(self._compactors) < len(other._compactors):
+            self._grow()
+        for level, items in enumerate(other._compactors):
+            self._compactors[level].extend(items)
+        self._size = sum(len(c) for c in self._compactors)
+        self.n += other.n
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or self.max < other.max:
+            self.max = other.max
+        self._compress()
+        return self
+
+    def _weighted(self):
+        pairs = [(x, 1 << level)
+                 for level, items in enumerate(self._compactors) for x in items]
+        pairs.sort(key=lambda p: p[0])
+        return pairs
+
+    def rank(self, value):
+        """Approximate number of values <= value."""
+        return sum(w for x, w in self._weighted() if x <= value)
+
+    def quantiles(self, qs):
+        """
+        Approximate quantiles for several fractions in one sorted pass.
+        :param qs: iterable of fractions in [0, 1]
+        :return: list of values, in the order of qs
+        """
+        if self.n == 0:
+            raise ValueError("Sketch is empty")
+        qs = list(qs)
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError("Quantile must be between 0 and 1")
+        pairs = self._weighted()
+        total = sum(w for _, w in pairs)
+        order = sorted(range(len(qs)), key=qs.__getitem__)
+        result = [None] * len(qs)
+        cumulative = 0
+        i = 0
+        for idx in order:
+            q = qs[idx]
+            if q == 0:
+                result[idx] = self.min
+                continue
+            if q == 1:
+                result[idx] = self.max
+                continue
+            target = q * total
+            while i < len(pairs) - 1 and cumulative + pairs[i][1] < target:
+                cumulative += pairs[i][1]
+                i += 1
+            result[idx] = pairs[i][0]
+        return result
+
+    def quantile(self, q):
+        """Approximate q-quantile, q in [0, 1]."""
+        return self.quantiles([q])[0]
+
+    def select(self, k):
+        """
+        Streaming counterpart of quick_select: approximate k-th smallest value.
+        :param k: 1-based rank
+        """
+        if not isinstance(k, int) or k < 1 or k > self.n:
+            raise ValueError("k must be between 1 and the number of values")
+        if k == 1:
+            return self.min
+        if k == self.n:
+            return self.max
+        return self.quantile(k / self.n)
+
+
+def stream_quantiles(iterable, qs, k=200, chunk_size=DEFAULT_CHUNK, seed=None):
+    """
+    Approximate quantiles of an iterable in O(k) memory.
+    :param iterable: iterable of numbers
+    :param qs: iterable of fractions in [0, 1]
+    :param k: sketch accuracy parameter
+    :param chunk_size: maximum chunk length
+    :return: list of values, in the order of qs
+    """
+    sketch = QuantileSketch(k, seed=seed)
+    for chunk in iter_chunks(iterable, chunk_size):
+        sketch.update_many(chunk)
+    return sketch.quantiles(qs)
+
+
+if __name__ == "__main__":
+    rng = random.Random(0)
+    values = (rng.gauss(0, 1) for _ in range(200000))
+    shard_a, shard_b = QuantileSketch(seed=1), QuantileSketch(seed=2)
+    shard_a.update_many(values)
+    shard_b.update_many(rng.gauss(0, 1) for _ in range(200000))
+    merged = shard_a.merge(shard_b)
+    print(f"Values seen: {len(merged)}, min={merged.min:.3f}, max={merged.max:.3f}")
+    for q, v in zip((0.5, 0.9, 0.99), merged.quantiles((0.5, 0.9, 0.99))):
+        print(f"p{int(q * 100)} ≈ {v:.3f}")
@@ -0,0 +1,92 @@
+import random
+from array import array
+
+import pytest
+import parallel
+from parallel import SharedArray, parallel_find_min_max, parallel_quick_select
+
+
+@pytest.fixture
+def force_parallel(monkeypatch):
+    monkeypatch.setattr(parallel, "_MIN_PARALLEL", 0)
+
+
+def test_shared_array_roundtrip():
+    with SharedArray([3, -1, 7]) as shared:
+        view = shared.view()
+        assert shared.format == "q" and list(view) == [3, -1, 7]
+        view.release()
+    with SharedArray([0.5, 2]) as shared:
+        view = shared.view()
+        assert shared.format == "d" and list(view) == [0.5, 2.0]
+        view.release()
+    with pytest.raises(ValueError):
+        SharedArray([2 ** 70])
+    with SharedArray([0.5, 2 ** 53]) as shared:
+        view = shared.view()
+        assert list(view) == [0.5, 2.0 ** 53]
+        view.release()
+    with pytest.raises(ValueError):
+        SharedArray([0.5, 2 ** 53 + 1])
+
+
+def test_shared_array_rejects_large_uint64():
+    np = pytest.importorskip("numpy")
+    with SharedArray(np.array([1, 2 ** 63 - 1], dtype=np.uint64)) as shared:
+        view = shared.view()
+        assert list(view) == [1, 2 ** 63 - 1]
+        view.release()
+    with pytest.raises(ValueError):
+        SharedArray(np.array([1, 2 ** 63], dtype=np.uint64))
+
+
+def test_parallel_find_min_max(force_parallel):
+    rng = random.Random(8)
+    data = [rng.randint(-10**9, 10**9) for _ in range(20001)]
+    assert parallel_find_min_max(data, workers=2) == (min(data), max(data))
+    buf = array("d", (x / 3 for x in data))
+    assert parallel_find_min_max(buf, workers=2) == (min(buf), max(buf))
+
+
+def test_parallel_find_min_max_small_and_empty():
+    assert parallel_find_min_max([4, 2, 9]) == (2, 9)
+    with pytest.raises(ValueError):
+        parallel_find_min_max([])
+
+
+def test_parallel_quick_select(force_parallel):
+    rng = random.Random(9)
+    data = [rng.randint(0, 500) for _ in range(30000)]
+    expected = sorted(data)
+    for k in (1, 7, 15000, 29999, 30000):
+        assert parallel_quick_select(data, k, workers=2, sample_size=256, seed=k) == expected[k - 1]
+
+
+class _TopSampler:
+    """Always samples the last elements, so the first brackets miss."""
+
+    def __init__(self, seed):
+        self.drawn = 0
+
+    def randrange(self, n):
+        self.drawn += 1
+        return n - self.drawn
+
+
+def test_parallel_quick_select_bracket_miss(force_parallel, monkeypatch):
+    monkeypatch.setattr(parallel.random, "Random", _TopSampler)
+    data = list(range(30000))
+    for k in (1, 15000, 29000):
+        assert parallel_quick_select(data, k, workers=2, sample_size=256) == k - 1
+
+
+def test_parallel_quick_select_numpy(force_parallel):
+    np = pytest.importorskip("numpy")
+    data = np.random.default_rng(10).normal(size=50000)
+    assert parallel_quick_select(data, 25000, workers=2, seed=0) == float(np.sort(data)[24999])
+
+
+def test_parallel_quick_select_invalid():
+    with pytest.raises(ValueError):
+        parallel_quick_select([1, 2, 3], 4)
+    assert parallel_quick_select([5, 1, 3], 2) == 3
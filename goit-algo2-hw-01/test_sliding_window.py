@@ -0,0 +1,59 @@
+import random
+
+import pytest
+from solution import find_min_max
+from sliding_window import SlidingMinMax, SparseTable, SegmentTree
+
+
+def test_sliding_min_max_matches_find_min_max():
+    rng = random.Random(11)
+    values = [rng.randint(-50, 50) for _ in range(500)]
+    for window in (1, 3, 17):
+        tracker = SlidingMinMax(window)
+        for i, x in enumerate(values):
+            tracker.push(x)
+            expected = find_min_max(values[max(0, i - window + 1):i + 1])
+            assert tracker.min_max() == expected
+            assert len(tracker) == min(i + 1, window)
+
+
+def test_sliding_min_max_pop():
+    tracker = SlidingMinMax(10)
+    tracker.extend([5, 1, 9, 3])
+    assert tracker.min_max() == (1, 9)
+    assert tracker.pop() == 5
+    assert tracker.pop() == 1
+    assert tracker.min_max() == (3, 9)
+    assert tracker.pop() == 9
+    assert tracker.min_max() == (3, 3)
+    tracker.pop()
+    with pytest.raises(IndexError):
+        tracker.pop()
+    with pytest.raises(ValueError):
+        tracker.min()
+    with pytest.raises(ValueError):
+        SlidingMinMax(0)
+
+
+@pytest.mark.parametrize("cls", [SparseTable, SegmentTree])
+def test_range_queries(cls):
+    rng = random.Random(12)
+    values = [rng.uniform(-1, 1) for _ in range(300)]
+    structure = cls(values)
+    for _ in range(500):
+        left = rng.randrange(len(values))
+        right = rng.randrange(left, len(values))
+        assert structure.query(left, right) == find_min_max(values[left:right + 1])
+    with pytest.raises(IndexError):
+        structure.query(5, 300)
+    with pytest.raises(ValueError):
+        cls([])
+
+
+def test_segment_tree_update():
+    tree = SegmentTree([4, 8, 15, 16, 23, 42])
+    tree.update(5, -1)
+    assert tree.query(0, 5) == (-1, 23)
+    tree.update(2, 100)
+    assert tree.query(1, 3) == (8, 100)
+    assert tree.query(2, 2) == (100, 100)
@@ -1,5 +1,9 @@
+import random
+from array import array
+
 import pytest
-from solution import find_min_max, quick_select
+import solution
+from solution import find_min_max, quick_select, quick_select_many, top_k, _select
 
 
 def test_find_min_max_single():
@@ -19,6 +23,41 @@ def test_find_min_max_negatives():
     assert find_min_max([-10, 0, 10, -20]) == (-20, 10)
 
 
+def test_find_min_max_long_list():
+    rng = random.Random(4)
+    for n in (999, 1000):
+        arr = [rng.randint(-10**6, 10**6) for _ in range(n)]
+        assert find_min_max(arr) == (min(arr), max(arr))
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_find_min_max_buffers(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(solution, "np", None)
+    data = array("d", [3.5, -1.25, 8.0] * 50000 + [-7.5])
+    assert find_min_max(data) == (-7.5, 8.0)
+    assert find_min_max(memoryview(data)) == (-7.5, 8.0)
+    assert find_min_max(bytes([9, 0, 255, 4])) == (0, 255)
+    assert find_min_max(bytearray(b"azc")) == (ord("a"), ord("z"))
+    with pytest.raises(ValueError):
+        find_min_max(array("i"))
+
+
+def test_find_min_max_numpy():
+    np = pytest.importorskip("numpy")
+    data = np.arange(-5, 200000, dtype=np.int64).reshape(5, -1)
+    assert find_min_max(data) == (-5, 199999)
+
+
+def test_find_min_max_invalid():
+    with pytest.raises(ValueError):
+        find_min_max([])
+    with pytest.raises(ValueError):
+        find_min_max(42)
+
+
 @pytest.mark.parametrize("arr,k,expected", [
     ([3, 1, 2], 1, 1),
     ([7, 10, 4, 3, 20, 15], 3, 7),
@@ -41,6 +80,108 @@ def test_quick_select_empty():
         quick_select([], 1)
 
 
+@pytest.mark.parametrize("arr", [
+    list(range(1000)),
+    list(range(1000, 0, -1)),
+    [7] * 1000,
+    [i % 3 for i in range(1000)],
+])
+def test_quick_select_adversarial(arr):
+    expected = sorted(arr)
+    for k in (1, 250, 500, 1000):
+        assert quick_select(arr, k) == expected[k - 1]
+
+
+def test_quick_select_does_not_mutate_by_default():
+    arr = [5, 3, 9, 1, 7]
+    quick_select(arr, 2)
+    assert arr == [5, 3, 9, 1, 7]
+
+
+def test_quick_select_inplace():
+    rng = random.Random(1)
+    arr = [rng.randint(-100, 100) for _ in range(500)]
+    expected = sorted(arr)[199]
+    assert quick_select(arr, 200, inplace=True) == expected
+    assert arr[199] == expected
+    assert all(x <= expected for x in arr[:199])
+    assert all(x >= expected for x in arr[200:])
+
+
+def test_select_median_of_medians_only():
+    # depth_limit=0 forces the worst-case linear pivot rule from the start
+    rng = random.Random(2)
+    arr = [rng.randint(0, 50) for _ in range(2000)]
+    expected = sorted(arr)
+    for target in (0, 777, 1999):
+        a = arr.copy()
+        assert _select(a, target, 0, len(a) - 1, depth_limit=0) == expected[target]
+
+
+def test_quick_select_many_matches_sorted():
+    rng = random.Random(3)
+    arr = [rng.randint(0, 1000) for _ in range(5000)]
+    expected = sorted(arr)
+    ks = [2500, 4500, 4950, 4995, 1, 5000, 2500]
+    assert quick_select_many(arr, ks) == [expected[k - 1] for k in ks]
+
+
+def test_quick_select_many_duplicates_and_small():
+    assert quick_select_many([4, 4, 4, 1], [1, 2, 4]) == [1, 4, 4]
+    assert quick_select_many([9], [1]) == [9]
+    assert quick_select_many([3, 1, 2], []) == []
+
+
+def test_quick_select_many_invalid():
+    with pytest.raises(ValueError):
+        quick_select_many([1, 2, 3], [1, 4])
+    with pytest.raises(ValueError):
+        quick_select_many([], [1])
+
+
+@pytest.mark.parametrize("arr", [
+    [random.Random(15).random() for _ in range(5000)],
+    list(range(5000)),
+    list(range(5000, 0, -1)),
+    [3] * 5000,
+    [i % 4 for i in range(5000)],
+])
+def test_quick_select_floyd_rivest(arr):
+    expected = sorted(arr)
+    for k in (1, 2, 2500, 4999, 5000):
+        assert quick_select(arr, k, method="floyd_rivest") == expected[k - 1]
+
+
+def test_quick_select_unknown_method():
+    with pytest.raises(ValueError):
+        quick_select([1, 2, 3], 1, method="bogo")
+
+
+@pytest.mark.parametrize("k", [1, 5, 200, 999, 1000])
+def test_top_k_matches_sorted(k):
+    rng = random.Random(13)
+    arr = [rng.randint(0, 300) for _ in range(1000)]
+    assert top_k(arr, k) == sorted(arr)[:k]
+    assert top_k(iter(arr), k) == sorted(arr)[:k]
+
+
+def test_top_k_key_is_stable():
+    rng = random.Random(14)
+    words = [f"{rng.choice('abc')}{i}" for i in range(300)]
+    for k in (3, 150):
+        assert top_k(words, k, key=lambda w: w[0]) == sorted(words, key=lambda w: w[0])[:k]
+
+
+def test_top_k_invalid():
+    with pytest.raises(ValueError):
+        top_k([1, 2], 3)
+    with pytest.raises(ValueError):
+        top_k([1, 2], 0)
+    with pytest.raises(ValueError):
+        top_k([], 1)
+    assert top_k(iter([3, 1]), 5) == [1, 3]
+
+
 if __name__ == "__main__":
     sample = [3, 5, 1, 2, 4, 6]
     print("Input list:", sample)
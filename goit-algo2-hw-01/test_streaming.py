@@ -0,0 +1,87 @@
+import random
+
+import pytest
+from streaming import (QuantileSketch, iter_chunks, read_numbers,
+                       stream_min_max, stream_quantiles)
+
+
+def test_iter_chunks():
+    assert list(iter_chunks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(iter_chunks([], 3)) == []
+    with pytest.raises(ValueError):
+        list(iter_chunks([1], 0))
+
+
+def test_stream_min_max_generator():
+    rng = random.Random(5)
+    values = [rng.uniform(-1e6, 1e6) for _ in range(10001)]
+    assert stream_min_max(iter(values), chunk_size=97) == (min(values), max(values))
+
+
+def test_stream_min_max_empty():
+    with pytest.raises(ValueError):
+        stream_min_max(iter([]))
+
+
+def test_read_numbers(tmp_path):
+    path = tmp_path / "metrics.txt"
+    path.write_text("3 -1.5\n7,2\n\n10\n", encoding="utf-8")
+    assert list(read_numbers(path)) == [3, -1.5, 7, 2, 10]
+    assert stream_min_max(read_numbers(path), chunk_size=2) == (-1.5, 10)
+    assert stream_quantiles(read_numbers(path), [0, 1]) == [-1.5, 10]
+
+
+def _rank_error(values, value):
+    ordered = sorted(values)
+    lo = sum(1 for x in ordered if x < value)
+    hi = sum(1 for x in ordered if x <= value)
+    return lo, hi
+
+
+def test_sketch_quantile_error_bounded():
+    rng = random.Random(6)
+    n = 50000
+    values = [rng.random() for _ in range(n)]
+    sketch = QuantileSketch(k=200, seed=0)
+    sketch.update_many(values)
+    assert len(sketch) == n
+    assert sketch.min == min(values) and sketch.max == max(values)
+    assert sum(len(c) for c in sketch._compactors) < 2000
+    for q in (0.01, 0.5, 0.9, 0.99):
+        lo, hi = _rank_error(values, sketch.quantile(q))
+        assert lo - 0.03 * n <= q * n <= hi + 0.03 * n
+
+
+def test_sketch_merge_matches_single_stream():
+    rng = random.Random(7)
+    a = [rng.gauss(0, 1) for _ in range(20000)]
+    b = [rng.gauss(5, 1) for _ in range(20000)]
+    left, right = QuantileSketch(seed=1), QuantileSketch(seed=2)
+    left.update_many(a)
+    for x in b[:100]:
+        right.update(x)
+    right.update_many(b[100:])
+    merged = left.merge(right)
+    assert len(merged) == 40000
+    assert merged.min == min(a + b) and merged.max == max(a + b)
+    lo, hi = _rank_error(a + b, merged.select(20000))
+    assert lo - 1200 <= 20000 <= hi + 1200
+
+
+def test_sketch_small_is_exact():
+    sketch = QuantileSketch()
+    sketch.update_many([5, 1, 4, 2, 3])
+    assert [sketch.select(k) for k in range(1, 6)] == [1, 2, 3, 4, 5]
+    assert sketch.rank(3) == 3
+
+
+def test_stream_quantiles_and_errors():
+    assert stream_quantiles(iter(range(1, 101)), [0, 0.5, 1]) == [1, 50, 100]
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+    sketch = QuantileSketch()
+    sketch.update(1)
+    with pytest.raises(ValueError):
+        sketch.quantile(1.5)
+    with pytest.raises(ValueError):
+        sketch.select(2)
@@ -0,0 +1,107 @@
+"""
+Бенчмарки продуктивності для домашнього завдання 2.
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from solution import JobColumns, optimize_printing, rod_cutting_table, np
+
+
+def _rod_cutting_lists(length, prices):
+    """Початкова табуляція: повний список розрізів для кожної довжини, O(n²) пам'яті."""
+    dp = [0] * (length + 1)
+    cut_choice = [[] for _ in range(length + 1)]
+    for r in range(1, length + 1):
+        max_profit = 0
+        best_cuts = []
+        for i in range(1, r + 1):
+            current = prices[i - 1] + dp[r - i]
+            if current > max_profit:
+                max_profit = current
+                best_cuts = cut_choice[r - i] + [i]
+        dp[r] = max_profit
+        cut_choice[r] = best_cuts
+    return dp[length], cut_choice[length]
+
+
+def _measure(func, *args, **kwargs):
+    """
+    Повертає (результат, час у секундах, піковий обсяг пам'яті в МБ).
+    Пам'ять вимірюється окремим запуском, бо tracemalloc уповільнює код.
+    """
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def benchmark_rod_cutting_table(lengths=(500, 1000, 2000), numpy_lengths=(10_000, 50_000)):
+    """Списки розрізів vs parent pointers vs векторизований рядок numpy."""
+    print("=== Rod Cutting (Table): час та пікова пам'ять ===")
+    print(f"{'довжина':>8} {'варіант':<16} {'час':>10} {'пам`ять':>12}")
+    for length in lengths:
+        prices = [random.randint(1, 3 * i) for i in range(1, length + 1)]
+        (profit, cuts), t, mem = _measure(_rod_cutting_lists, length, prices)
+        print(f"{length:>8} {'cut lists':<16} {t:>9.3f}s {mem:>9.2f} MB")
+        res, t, mem = _measure(rod_cutting_table, length, prices)
+        assert (res["max_profit"], res["cuts"]) == (profit, cuts)
+        print(f"{length:>8} {'parent pointers':<16} {t:>9.3f}s {mem:>9.2f} MB")
+        if np is not None:
+            res, t, mem = _measure(rod_cutting_table, length, prices, use_numpy=True)
+            assert (res["max_profit"], res["cuts"]) == (profit, cuts)
+            print(f"{length:>8} {'numpy':<16} {t:>9.3f}s {mem:>9.2f} MB")
+
+    if np is None:
+        print("\nnumpy не встановлено — векторизований варіант пропущено")
+        return
+    for length in numpy_lengths:
+        prices = [random.randint(1, 3 * i) for i in range(1, length + 1)]
+        res, t, mem = _measure(rod_cutting_table, length, prices, use_numpy=True)
+        print(f"{length:>8} {'numpy':<16} {t:>9.3f}s {mem:>9.2f} MB")
+
+
+def generate_print_jobs(n, priorities=3, seed=None):
+    """Випадкові завдання друку: об'єм 10–250, час 10–240 хв, пріоритети 1..priorities."""
+    rng = random.Random(seed)
+    return [{"id": f"J{i}", "volume": rng.randint(10, 250),
+             "priority": rng.randint(1, priorities), "print_time": rng.randint(10, 240)}
+            for i in range(n)]
+
+
+def benchmark_printing(sizes=(10_000, 100_000), constraints=None):
+    """total_time і пропускна здатність стратегій optimize_printing."""
+    constraints = constraints or {"max_volume": 500, "max_items": 5}
+    print("\n=== optimize_printing: стратегії групування ===")
+    print(f"{'завдань':>9} {'стратегія':<22} {'total_time':>12} {'зміна':>8} {'завдань/с':>12}")
+    for n in sizes:
+        jobs = generate_print_jobs(n, seed=n)
+        baseline = None
+        for strategy in ("greedy", "first_fit_decreasing", "best_fit", "similar_time"):
+            start = time.perf_counter()
+            res = optimize_printing(jobs, constraints, strategy=strategy)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = res["total_time"]
+            change = (res["total_time"] - baseline) / baseline * 100
+            print(f"{n:>9} {strategy:<22} {res['total_time']:>12} {change:>7.1f}% {n / elapsed:>12.0f}")
+        # "greedy" прямо над масивами JobColumns, без об'єкта на кожне завдання
+        columns = JobColumns.from_records(jobs)
+        start = time.perf_counter()
+        res = optimize_printing(columns, constraints)
+        elapsed = time.perf_counter() - start
+        assert res["total_time"] == baseline
+        print(f"{n:>9} {'greedy (JobColumns)':<22} {res['total_time']:>12.0f} {0.0:>7.1f}% {n / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    random.seed(42)
+    # --full додає довжину 100 000 для numpy-варіанта (кілька хвилин)
+    full = "--full" in sys.argv
+    benchmark_rod_cutting_table(numpy_lengths=(10_000, 50_000) + ((100_000,) if full else ()))
+    benchmark_printing(sizes=(10_000, 100_000, 500_000) + ((1_000_000,) if full else ()))
@@ -1,10 +1,24 @@
-from typing import List, Dict
-from dataclasses import dataclass
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple, Union
+from array import array
+from bisect import bisect_right, insort
+from collections import OrderedDict, deque
+import csv
+import heapq
+import json
+import math
+from dataclasses import dataclass, field
 import random
-from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy потрібен лише для rod_cutting_table(..., use_numpy=True)
+    np = None
 
 @dataclass
 class PrintJob:
+    # __slots__ замість __dict__: менше пам'яті на завдання у великих чергах
+    __slots__ = ("id", "volume", "priority", "print_time")
     id: str
     volume: float
     priority: int
@@ -16,75 +30,498 @@ class PrinterConstraints:
     max_items: int
 
 
-def optimize_printing(print_jobs: List[Dict], constraints: Dict) -> Dict:
+class JobColumns:
+    """
+    Колонкове представлення черги друку: ID у списку, числові поля
+    у компактних масивах array ('d' для об'єму й часу друку, 'l' для пріоритету).
+    Індексація повертає PrintJob, тож колонки можна використовувати як список завдань.
     """
-    Оптимізує чергу 3D-друку згідно з пріоритетами та обмеженнями принтера
 
-    Returns:
-        Dict з полями "print_order" та "total_time"
+    def __init__(self):
+        self.ids: List[str] = []
+        self.volume = array("d")
+        self.priority = array("l")
+        self.print_time = array("d")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> PrintJob:
+        return PrintJob(self.ids[i], self.volume[i], self.priority[i], self.print_time[i])
+
+    def __iter__(self) -> Iterator[PrintJob]:
+        return map(PrintJob, self.ids, self.volume, self.priority, self.print_time)
+
+    def append(self, job_id: str, volume: float, priority: int, print_time: float) -> None:
+        self.ids.append(str(job_id))
+        self.volume.append(float(volume))
+        self.priority.append(int(priority))
+        self.print_time.append(float(print_time))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "JobColumns":
+        columns = cls()
+        for rec in records:
+            columns.append(rec["id"], rec["volume"], rec["priority"], rec["print_time"])
+        return columns
+
+
+def load_jobs_jsonl(path: str) -> JobColumns:
+    """Потоково читає завдання з JSONL (один JSON-об'єкт на рядок) у колонки"""
+    with open(path, encoding="utf-8") as f:
+        return JobColumns.from_records(json.loads(line) for line in f if line.strip())
+
+
+def load_jobs_csv(path: str) -> JobColumns:
+    """Потоково читає завдання з CSV (заголовок id,volume,priority,print_time) у колонки"""
+    with open(path, newline="", encoding="utf-8") as f:
+        return JobColumns.from_records(csv.DictReader(f))
+
+
+def load_print_jobs(path: str) -> JobColumns:
+    """Обирає завантажувач за розширенням файлу (.jsonl / .csv)"""
+    if path.endswith(".jsonl"):
+        return load_jobs_jsonl(path)
+    if path.endswith(".csv"):
+        return load_jobs_csv(path)
+    raise ValueError(f"Непідтримуваний формат файлу: {path}")
+
+
+def _next_fit_bounds(volumes: Iterable[float], cons: PrinterConstraints) -> Iterator[Tuple[int, int]]:
+    """
+    Жадібне групування: межі [start, end) груп поспіль ідучих завдань;
+    група закривається, щойно наступне завдання не вміщується
     """
+    start = 0
+    end = -1
+    current_volume = 0.0
+    for end, v in enumerate(volumes):
+        if end > start and (end - start >= cons.max_items or current_volume + v > cons.max_volume):
+            yield start, end
+            start = end
+            current_volume = 0.0
+        current_volume += v
+    if end >= start:
+        yield start, end + 1
+
+
+def _next_fit_columns(columns: JobColumns, cons: PrinterConstraints) -> Tuple[List[str], float]:
+    """Жадібне групування (як _next_fit) безпосередньо над колонками, без об'єктів PrintJob"""
+    order = sorted(range(len(columns)), key=columns.priority.__getitem__)
+    times = [columns.print_time[i] for i in order]
+    bounds = _next_fit_bounds(map(columns.volume.__getitem__, order), cons)
+    total_time = sum(max(times[start:end]) for start, end in bounds)
+    return [columns.ids[i] for i in order], total_time
+
+
+def _next_fit(jobs: List[PrintJob], cons: PrinterConstraints) -> List[List[PrintJob]]:
+    """Жадібне групування завдань у заданому порядку (див. _next_fit_bounds)"""
+    return [jobs[start:end] for start, end in _next_fit_bounds([job.volume for job in jobs], cons)]
+
+
+def _first_fit_decreasing(jobs: List[PrintJob], cons: PrinterConstraints) -> List[List[PrintJob]]:
+    """
+    First-fit-decreasing за об'ємом: кожне завдання йде в першу групу, де є місце.
+    Дерево відрізків над вільним об'ємом груп знаходить таку групу за O(log n);
+    ще не відкриті групи мають повний об'єм, тож нова група — найлівіша з них.
+    """
+    size = 1
+    while size < len(jobs):
+        size *= 2
+    free = [cons.max_volume] * (2 * size)
+    groups: List[List[PrintJob]] = []
+    used: List[float] = []
+
+    def set_free(pos: int, value: float) -> None:
+        pos += size
+        free[pos] = value
+        pos //= 2
+        while pos:
+            free[pos] = max(free[2 * pos], free[2 * pos + 1])
+            pos //= 2
+
+    for job in sorted(jobs, key=lambda j: j.volume, reverse=True):
+        if free[1] >= job.volume:
+            pos = 1
+            while pos < size:
+                pos = 2 * pos if free[2 * pos] >= job.volume else 2 * pos + 1
+            pos -= size
+        else:
+            # Завдання більше за max_volume друкується окремою групою
+            pos = len(groups)
+        if pos == len(groups):
+            groups.append([])
+            used.append(0.0)
+        groups[pos].append(job)
+        used[pos] += job.volume
+        full = len(groups[pos]) >= cons.max_items or used[pos] > cons.max_volume
+        set_free(pos, -1.0 if full else cons.max_volume - used[pos])
+    return groups
+
+
+def _best_fit_decreasing(jobs: List[PrintJob], cons: PrinterConstraints) -> List[List[PrintJob]]:
+    """
+    Best-fit-decreasing за об'ємом: кожне завдання йде в групу з найменшим
+    залишком місця, куди воно ще вміщується. Відкриті групи зберігаються
+    відсортованими за зайнятим об'ємом, пошук — bisect.
+    """
+    groups: List[List[PrintJob]] = []
+    # (зайнятий об'єм, -індекс групи): серед рівних обирається найраніша група
+    open_groups: List[Tuple[float, int]] = []
+    for job in sorted(jobs, key=lambda j: j.volume, reverse=True):
+        pos = bisect_right(open_groups, (cons.max_volume - job.volume, 1)) - 1
+        if pos >= 0:
+            volume, idx = open_groups.pop(pos)
+            idx = -idx
+        else:
+            volume, idx = 0.0, len(groups)
+            groups.append([])
+        groups[idx].append(job)
+        volume += job.volume
+        if len(groups[idx]) < cons.max_items and volume < cons.max_volume:
+            insort(open_groups, (volume, -idx))
+    return groups
+
+
+def _similar_time(jobs: List[PrintJob], cons: PrinterConstraints) -> List[List[PrintJob]]:
+    """Групування завдань зі схожим print_time: сортування за часом, далі next-fit"""
+    return _next_fit(sorted(jobs, key=lambda j: j.print_time, reverse=True), cons)
+
+
+_PACKING_STRATEGIES = {
+    "first_fit_decreasing": _first_fit_decreasing,
+    "best_fit": _best_fit_decreasing,
+    "similar_time": _similar_time,
+}
+
+
+def _group_jobs(print_jobs: Union[List[Dict], JobColumns], constraints: Dict,
+                strategy: str) -> List[List[PrintJob]]:
+    """Групує завдання обраною стратегією; групи йдуть у порядку пріоритетів"""
     # Підготувати дані
-    jobs = [PrintJob(**job) for job in print_jobs]
+    if isinstance(print_jobs, JobColumns):
+        jobs = list(print_jobs)
+    else:
+        jobs = [PrintJob(**job) for job in print_jobs]
     cons = PrinterConstraints(**constraints)
     # Сортуємо за пріоритетом (1 найвищий)
     jobs.sort(key=lambda x: x.priority)
 
+    if strategy == "greedy":
+        return _next_fit(jobs, cons)
+    if strategy not in _PACKING_STRATEGIES:
+        raise ValueError(f"Невідома стратегія: {strategy}")
+    pack = _PACKING_STRATEGIES[strategy]
+    groups: List[List[PrintJob]] = []
+    start = 0
+    while start < len(jobs):
+        end = start
+        while end < len(jobs) and jobs[end].priority == jobs[start].priority:
+            end += 1
+        groups.extend(pack(jobs[start:end], cons))
+        start = end
+    return groups
+
+
+def optimize_printing(print_jobs: Union[List[Dict], JobColumns], constraints: Dict,
+                      strategy: str = "greedy") -> Dict:
+    """
+    Оптимізує чергу 3D-друку згідно з пріоритетами та обмеженнями принтера.
+    print_jobs — список словників або JobColumns (див. load_print_jobs);
+    для JobColumns зі стратегією "greedy" групування виконується прямо над масивами.
+
+    strategy:
+        "greedy" — жадібне групування у порядку пріоритету (група закривається,
+                   щойно наступне завдання не вміщується; групи можуть
+                   поєднувати сусідні пріоритети);
+        "first_fit_decreasing", "best_fit", "similar_time" — пакування
+                   окремо в межах кожного пріоритету, пріоритети йдуть по черзі.
+
+    Returns:
+        Dict з полями "print_order" та "total_time"
+    """
+    if isinstance(print_jobs, JobColumns) and strategy == "greedy":
+        print_order, total_time = _next_fit_columns(print_jobs, PrinterConstraints(**constraints))
+        return {"print_order": print_order, "total_time": total_time}
+
     print_order: List[str] = []
     total_time = 0
-    current_group: List[PrintJob] = []
-    current_volume = 0.0
-
-    def flush_group():
-        nonlocal total_time, print_order, current_group
-        if not current_group:
-            return
+    for group in _group_jobs(print_jobs, constraints, strategy):
         # Час групи = максимальний час друку серед завдань у групі
-        group_time = max(job.print_time for job in current_group)
+        total_time += max(job.print_time for job in group)
+        print_order.extend(job.id for job in group)
+
+    return {"print_order": print_order, "total_time": total_time}
+
+
+def optimize_printing_multi(print_jobs: Union[List[Dict], JobColumns], constraints: Dict, num_printers: int,
+                            strategy: str = "greedy") -> Dict:
+    """
+    Розподіляє групи, сформовані optimize_printing, між num_printers принтерами.
+    Усередині кожного пріоритету групи йдуть за спаданням часу
+    (longest-processing-time-first), кожна потрапляє на принтер, що звільняється
+    першим (купа часів завершення). Групи видаються по черзі пріоритетів, тож
+    група вищого пріоритету ніколи не стартує пізніше за групу нижчого.
+
+    Returns:
+        Dict з полями "printers" (порядок ID завдань для кожного принтера),
+        "makespan" (час завершення останнього принтера) та "total_time"
+        (сумарний час груп, як в optimize_printing)
+    """
+    if not isinstance(num_printers, int) or num_printers < 1:
+        raise ValueError("num_printers має бути додатним цілим")
+    groups = _group_jobs(print_jobs, constraints, strategy)
+    # Пріоритет групи — найвищий (найменший) пріоритет її завдань
+    timed = [(min(job.priority for job in group), max(job.print_time for job in group), group)
+             for group in groups]
+    timed.sort(key=lambda g: (g[0], -g[1]))
+
+    printers: List[List[str]] = [[] for _ in range(num_printers)]
+    finish = [(0, p) for p in range(num_printers)]  # (час звільнення, принтер)
+    total_time = 0
+    for _, group_time, group in timed:
+        free_at, p = heapq.heappop(finish)
+        printers[p].extend(job.id for job in group)
+        heapq.heappush(finish, (free_at + group_time, p))
         total_time += group_time
-        print_order.extend(job.id for job in current_group)
-        current_group.clear()
 
-    for job in jobs:
-        # Спроба додати в поточну групу
-        if (len(current_group) < cons.max_items and
-            current_volume + job.volume <= cons.max_volume):
-            current_group.append(job)
-            current_volume += job.volume
+    return {
+        "printers": printers,
+        "makespan": max(t for t, _ in finish),
+        "total_time": total_time,
+    }
+
+
+@dataclass
+class PrintGroup:
+    job_ids: List[str]
+    volume: float
+    print_time: int
+
+
+class PrintScheduler:
+    """
+    Онлайн-планувальник черги 3D-друку.
+    Завдання надходять поступово в купу з ключем (priority, порядок надходження);
+    група фіксується, щойно вона заповнена: досягнуто max_items або наступне
+    за пріоритетом завдання не вміщується за об'ємом. Вставка та видача —
+    O(log n) на завдання. Якщо всі завдання подано до flush(), порядок і
+    загальний час збігаються з optimize_printing.
+    """
+
+    def __init__(self, constraints):
+        if isinstance(constraints, dict):
+            constraints = PrinterConstraints(**constraints)
+        self.constraints = constraints
+        self._heap: List[Tuple[int, int, PrintJob]] = []
+        self._seq = 0
+        self.print_order: List[str] = []
+        self.total_time = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def submit(self, job) -> None:
+        """Додає завдання (dict або PrintJob) у чергу"""
+        if isinstance(job, dict):
+            job = PrintJob(**job)
+        heapq.heappush(self._heap, (job.priority, self._seq, job))
+        self._seq += 1
+
+    def dispatch(self, force: bool = False) -> Optional[PrintGroup]:
+        """
+        Формує наступну групу з найпріоритетніших завдань.
+        Неповну групу (черга закінчилась раніше) повертає лише при force=True,
+        інакше завдання лишаються в черзі й повертається None.
+        """
+        heap = self._heap
+        cons = self.constraints
+        taken: List[Tuple[int, int, PrintJob]] = []
+        volume = 0.0
+        full = False
+        while heap:
+            job = heap[0][2]
+            if taken and (len(taken) >= cons.max_items or volume + job.volume > cons.max_volume):
+                full = True
+                break
+            taken.append(heapq.heappop(heap))
+            volume += job.volume
+        if not taken:
+            return None
+        if not full and len(taken) >= cons.max_items:
+            full = True
+        if not full and not force:
+            for entry in taken:
+                heapq.heappush(heap, entry)
+            return None
+
+        group = PrintGroup(
+            job_ids=[entry[2].id for entry in taken],
+            volume=volume,
+            # Час групи = максимальний час друку серед завдань у групі
+            print_time=max(entry[2].print_time for entry in taken),
+        )
+        self.print_order.extend(group.job_ids)
+        self.total_time += group.print_time
+        return group
+
+    def ready_groups(self) -> Iterator[PrintGroup]:
+        """Видає всі групи, які вже заповнені"""
+        while True:
+            group = self.dispatch()
+            if group is None:
+                return
+            yield group
+
+    def flush(self) -> Iterator[PrintGroup]:
+        """Видає всі групи, включно з останньою неповною"""
+        while self._heap:
+            yield self.dispatch(force=True)
+
+
+@dataclass
+class _RodTable:
+    """Розв'язки підзадач для однієї таблиці цін: dp[r] та останній шматок parent[r]"""
+    prices: Tuple[int, ...]
+    dp: List[int] = field(default_factory=lambda: [0])
+    parent: List[int] = field(default_factory=lambda: [0])
+
+    def extend(self, length: int) -> None:
+        """Дораховує підзадачі знизу вгору від уже відомої довжини до length"""
+        prices, dp, parent = self.prices, self.dp, self.parent
+        for r in range(len(dp), length + 1):
+            max_profit = 0
+            best_cut = 0
+            for i in range(1, r + 1):
+                current = prices[i - 1] + dp[r - i]
+                if current > max_profit:
+                    max_profit = current
+                    best_cut = i
+            dp.append(max_profit)
+            parent.append(best_cut)
+
+
+class RodCuttingMemo:
+    """
+    Спільний кеш розв'язків rod cutting, ключ — таблиця цін.
+    Повторні запити з тими ж цінами не перераховують уже відомі довжини,
+    довші запити лише дораховують нові підзадачі (без рекурсії).
+    Зберігається не більше max_tables таблиць, найдавніше використана
+    витісняється першою (LRU).
+    """
+
+    def __init__(self, max_tables: int = 32):
+        if max_tables < 1:
+            raise ValueError("max_tables має бути додатним")
+        self.max_tables = max_tables
+        self._tables: "OrderedDict[Tuple[int, ...], _RodTable]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def table(self, prices: List[int]) -> _RodTable:
+        key = tuple(prices)
+        table = self._tables.get(key)
+        if table is None:
+            self.misses += 1
+            table = _RodTable(key)
+            self._tables[key] = table
+            if len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
         else:
-            # Фіксація поточної групи
-            flush_group()
-            # Започаткувати нову
-            current_group.append(job)
-            current_volume = job.volume
+            self.hits += 1
+            self._tables.move_to_end(key)
+        return table
 
-    # Фіксація останньої групи
-    flush_group()
+    def solve(self, length: int, prices: List[int]) -> Dict:
+        table = self.table(prices)
+        table.extend(length)
+        cuts = _reconstruct_cuts(table.parent, length)
+        return {
+            "max_profit": table.dp[length],
+            "cuts": cuts,
+            "number_of_cuts": max(0, len(cuts) - 1)
+        }
+
+    def cache_info(self) -> Dict:
+        return {"hits": self.hits, "misses": self.misses,
+                "tables": len(self._tables), "max_tables": self.max_tables}
+
+    def clear(self) -> None:
+        self._tables.clear()
+        self.hits = self.misses = 0
+
+
+_default_memo = RodCuttingMemo()
+
+
+def rod_cutting_memo(length: int, prices: List[int], memo: Optional[RodCuttingMemo] = None) -> Dict:
+    """
+    Знаходить оптимальне розрізання стрижня через мемоізацію.
+    Мемо спільне між викликами (за замовчуванням — модульне RodCuttingMemo),
+    підзадачі обчислюються знизу вгору, тож немає обмеження глибини рекурсії.
+
+    Returns:
+        Dict з полями "max_profit", "cuts", "number_of_cuts"
+    """
+    return (memo or _default_memo).solve(length, prices)
 
-    return {"print_order": print_order, "total_time": total_time}
 
+def _reconstruct_cuts(parent: List[int], length: int) -> List[int]:
+    """
+    Відновлює розрізи з масиву батьківських вказівників
+    (parent[r] — довжина останнього шматка для стрижня довжини r, 0 — без розрізу)
+    """
+    cuts: List[int] = []
+    r = length
+    while r > 0 and parent[r]:
+        cuts.append(parent[r])
+        r -= parent[r]
+    cuts.reverse()
+    return cuts
+
+
+def _rod_table(length: int, prices: List[int]):
+    table = _RodTable(tuple(prices[:length]))
+    table.extend(length)
+    return table.dp[length], table.parent
+
+
+def _rod_table_numpy(length: int, prices: List[int]):
+    price_arr = np.asarray(prices[:length])
+    dp = np.zeros(length + 1, dtype=price_arr.dtype)
+    parent = [0] * (length + 1)
+
+    for r in range(1, length + 1):
+        # candidates[i - 1] = prices[i - 1] + dp[r - i]
+        candidates = price_arr[:r] + dp[r - 1::-1]
+        # argmax повертає перший максимум — як і строге ">" у циклі
+        best = int(candidates.argmax())
+        if candidates[best] > 0:
+            dp[r] = candidates[best]
+            parent[r] = best + 1
+
+    return dp[length].item(), parent
 
-def rod_cutting_memo(length: int, prices: List[int]) -> Dict:
+
+def rod_cutting_table(length: int, prices: List[int], use_numpy: bool = False) -> Dict:
     """
-    Знаходить оптимальне розрізання стрижня через мемоізацію
+    Знаходить оптимальне розрізання стрижня через табуляцію.
+    Пам'ять O(n): для кожної довжини зберігається лише останній шматок
+    (parent pointer), розрізи відновлюються один раз наприкінці.
+    При use_numpy=True кожен рядок prices[:r] + dp[r-1::-1] обчислюється
+    векторно, що робить можливими довжини 50k–100k.
 
     Returns:
         Dict з полями "max_profit", "cuts", "number_of_cuts"
     """
-    @lru_cache(None)
-    def best(r: int):
-        if r == 0:
-            return 0, []
-        max_profit = 0
-        best_cuts: List[int] = []
-        for i in range(1, r + 1):
-            profit_rest, cuts_rest = best(r - i)
-            current = prices[i - 1] + profit_rest
-            if current > max_profit:
-                max_profit = current
-                best_cuts = cuts_rest + [i]
-        return max_profit, best_cuts
-
-    profit, cuts = best(length)
+    if use_numpy:
+        if np is None:
+            raise ImportError("use_numpy=True потребує встановленого numpy")
+        profit, parent = _rod_table_numpy(length, prices)
+    else:
+        profit, parent = _rod_table(length, prices)
+
+    cuts = _reconstruct_cuts(parent, length)
     return {
         "max_profit": profit,
         "cuts": cuts,
@@ -92,32 +529,136 @@ def rod_cutting_memo(length: int, prices: List[int]) -> Dict:
     }
 
 
-def rod_cutting_table(length: int, prices: List[int]) -> Dict:
+def rod_cutting_batch(lengths: List[int], prices: List[int]) -> List[Dict]:
     """
-    Знаходить оптимальне розрізання стрижня через табуляцію
+    Оптимальні розрізання для багатьох довжин з однією таблицею цін.
+    Таблиця dp/parent будується один раз до max(lengths), кожна відповідь
+    відновлюється з неї: O(max_len^2 + сума розмірів відповідей).
 
     Returns:
-        Dict з полями "max_profit", "cuts", "number_of_cuts"
+        List[Dict] з полями "max_profit", "cuts", "number_of_cuts" у порядку lengths
     """
-    dp = [0] * (length + 1)
-    cut_choice: List[List[int]] = [[] for _ in range(length + 1)]
+    if not lengths:
+        return []
+    max_len = max(lengths)
+    if min(lengths) < 0:
+        raise ValueError("Довжини мають бути невід'ємними")
+    table = _RodTable(tuple(prices[:max_len]))
+    table.extend(max_len)
 
-    for r in range(1, length + 1):
-        max_profit = 0
-        best_cuts: List[int] = []
-        for i in range(1, r + 1):
-            current = prices[i - 1] + dp[r - i]
-            if current > max_profit:
-                max_profit = current
-                best_cuts = cut_choice[r - i] + [i]
-        dp[r] = max_profit
-        cut_choice[r] = best_cuts
-
-    cuts = cut_choice[length]
+    results = []
+    for length in lengths:
+        cuts = _reconstruct_cuts(table.parent, length)
+        results.append({
+            "max_profit": table.dp[length],
+            "cuts": cuts,
+            "number_of_cuts": max(0, len(cuts) - 1)
+        })
+    return results
+
+
+def _bounded_step(dp: List[float], w: int, value: float, limit: int,
+                  counts: Optional[array] = None) -> List[float]:
+    """
+    Додає шматки довжини w (не більше limit штук) до dp обмеженого рюкзака.
+    Індекси j розбиваються за залишком j mod w, максимум по вікну з limit
+    попередніх значень тримає монотонна черга — O(n) замість O(n·limit).
+    Якщо задано counts, counts[j] — скільки шматків довжини w взято для j.
+    """
+    if limit <= 0:
+        return dp
+    neg = float("-inf")
+    length = len(dp) - 1
+    new = dp[:]
+    for r in range(w):
+        window: deque = deque()  # (t, dp[r + t*w] - t*value), значення спадають
+        for t, j in enumerate(range(r, length + 1, w)):
+            if dp[j] != neg:
+                key = dp[j] - t * value
+                while window and window[-1][1] <= key:
+                    window.pop()
+                window.append((t, key))
+            while window and window[0][0] < t - limit:
+                window.popleft()
+            if window:
+                s, key = window[0]
+                new[j] = key + t * value
+                if counts is not None:
+                    counts[j] = t - s
+    return new
+
+
+def rod_cutting_bounded(length: int, prices: List[int], cut_cost: float = 0,
+                        max_counts: Optional[List[Optional[int]]] = None) -> Dict:
+    """
+    Розрізання стрижня з вартістю кожного розрізу та обмеженою кількістю
+    шматків кожної довжини (обмежений рюкзак).
+    Кожен шматок «коштує» один розріз; якщо шматки покривають увесь стрижень,
+    останній розріз не потрібен, інакше він відділяє залишок (waste).
+    Кожна довжина шматка обробляється за O(n) монотонною чергою (_bounded_step),
+    разом O(n·m). Вказівники «скільки шматків взято» для всіх m довжин зайняли б
+    O(n·m) пам'яті, тому прямий прохід зберігає dp лише кожні ~√m довжин, а
+    при відновленні розрізів блоки перераховуються з вказівниками у зворотному
+    порядку: O(n·√m) пам'яті ціною ще одного проходу DP.
+
+    max_counts[i] — максимум шматків довжини i+1 (None — без обмеження).
+
+    Returns:
+        Dict з полями "max_profit", "cuts", "number_of_cuts", "waste"
+    """
+    m = min(len(prices), length)
+    if max_counts is None:
+        max_counts = [None] * len(prices)
+    if len(max_counts) != len(prices):
+        raise ValueError("max_counts має бути тієї ж довжини, що й prices")
+
+    def limit(i: int) -> int:
+        w = i + 1
+        return length // w if max_counts[i] is None else min(max_counts[i], length // w)
+
+    neg = float("-inf")
+    block = max(1, math.isqrt(m))
+    # dp[j] — найкращий прибуток (за вирахуванням розрізу на кожен шматок),
+    # якщо шматки займають рівно j одиниць довжини
+    dp = [neg] * (length + 1)
+    dp[0] = 0
+    checkpoints: List[List[float]] = []
+    for i in range(m):
+        if i % block == 0:
+            checkpoints.append(dp)
+        dp = _bounded_step(dp, i + 1, prices[i] - cut_cost, limit(i))
+
+    best_j = 0
+    max_profit = 0
+    for j in range(length + 1):
+        if dp[j] == neg:
+            continue
+        # Шматки покривають увесь стрижень — останній розріз не потрібен
+        profit = dp[j] + (cut_cost if j == length and j > 0 else 0)
+        if profit > max_profit:
+            max_profit, best_j = profit, j
+
+    cuts: List[int] = []
+    j = best_j
+    for b in range(len(checkpoints) - 1, -1, -1):
+        first = b * block
+        items = range(first, min(first + block, m))
+        take: List[array] = []
+        dp = checkpoints[b]
+        for i in items:
+            counts = array("I", [0]) * (length + 1)
+            dp = _bounded_step(dp, i + 1, prices[i] - cut_cost, limit(i), counts)
+            take.append(counts)
+        for i in reversed(items):
+            count = take[i - first][j]
+            cuts.extend([i + 1] * count)
+            j -= count * (i + 1)
+    number_of_cuts = len(cuts) - 1 if best_j == length else len(cuts)
     return {
-        "max_profit": dp[length],
+        "max_profit": max_profit,
         "cuts": cuts,
-        "number_of_cuts": max(0, len(cuts) - 1)
+        "number_of_cuts": max(0, number_of_cuts),
+        "waste": length - best_j,
     }
 
 
@@ -132,6 +673,19 @@ if __name__ == "__main__":
     constraints = {"max_volume": 300, "max_items": 2}
     print(optimize_printing(jobs, constraints))
 
+    print("\n=== Online Print Scheduler ===")
+    scheduler = PrintScheduler(constraints)
+    for job in jobs:
+        scheduler.submit(job)
+        for group in scheduler.ready_groups():
+            print("ready:", group)
+    for group in scheduler.flush():
+        print("flush:", group)
+    print({"print_order": scheduler.print_order, "total_time": scheduler.total_time})
+
+    print("\n=== Multi-printer Scheduling ===")
+    print(optimize_printing_multi(jobs, {"max_volume": 300, "max_items": 1}, num_printers=2))
+
     print("\n=== Rod Cutting (Memo) ===")
     length = 5
     prices = [2, 5, 7, 8, 10]
@@ -139,3 +693,10 @@ if __name__ == "__main__":
 
     print("\n=== Rod Cutting (Table) ===")
     print(rod_cutting_table(length, prices))
+
+    print("\n=== Rod Cutting (Batch) ===")
+    for res in rod_cutting_batch([1, 3, 5], prices):
+        print(res)
+
+    print("\n=== Rod Cutting (Bounded, cut cost 1) ===")
+    print(rod_cutting_bounded(length, prices, cut_cost=1, max_counts=[1, 1, 1, 1, 1]))
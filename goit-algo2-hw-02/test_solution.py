@@ -6,8 +6,28 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 
 
+import csv
+import itertools
+import json
+import random
+
 import pytest
-from solution import optimize_printing, rod_cutting_memo, rod_cutting_table
+from benchmark import _rod_cutting_lists
+from solution import (
+    _PACKING_STRATEGIES,
+    JobColumns,
+    PrintJob,
+    PrinterConstraints,
+    PrintScheduler,
+    RodCuttingMemo,
+    load_print_jobs,
+    optimize_printing,
+    optimize_printing_multi,
+    rod_cutting_batch,
+    rod_cutting_bounded,
+    rod_cutting_memo,
+    rod_cutting_table,
+)
 
 # Test data for optimize_printing
 @pytest.fixture
@@ -56,6 +76,181 @@ def test_printing_overflow(jobs_overflow, printing_constraints):
     assert res["print_order"] == ["M1", "M2", "M3"]
     assert res["total_time"] == 450
 
+
+def _random_jobs(rng, n):
+    return [{"id": f"J{i}", "volume": rng.randint(10, 200), "priority": rng.randint(1, 3),
+             "print_time": rng.randint(10, 200)} for i in range(n)]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_scheduler_matches_batch_optimizer(seed):
+    rng = random.Random(seed)
+    jobs = _random_jobs(rng, 200)
+    constraints = {"max_volume": 300, "max_items": 3}
+    scheduler = PrintScheduler(constraints)
+    for job in jobs:
+        scheduler.submit(job)
+    groups = list(scheduler.flush())
+    expected = optimize_printing(jobs, constraints)
+    assert scheduler.print_order == expected["print_order"]
+    assert scheduler.total_time == expected["total_time"]
+    assert sum(len(g.job_ids) for g in groups) == len(jobs) and len(scheduler) == 0
+
+
+def test_scheduler_yields_only_full_groups(printing_constraints):
+    scheduler = PrintScheduler(printing_constraints)
+    scheduler.submit({"id": "A", "volume": 100, "priority": 2, "print_time": 60})
+    assert list(scheduler.ready_groups()) == []
+    assert len(scheduler) == 1
+    scheduler.submit({"id": "B", "volume": 100, "priority": 1, "print_time": 30})
+    [group] = scheduler.ready_groups()
+    assert group.job_ids == ["B", "A"] and group.print_time == 60
+    scheduler.submit({"id": "C", "volume": 250, "priority": 1, "print_time": 90})
+    scheduler.submit({"id": "D", "volume": 100, "priority": 1, "print_time": 20})
+    # C і D не вміщуються разом за об'ємом — C фіксується сама
+    [group] = scheduler.ready_groups()
+    assert group.job_ids == ["C"]
+    assert [g.job_ids for g in scheduler.flush()] == [["D"]]
+    assert scheduler.total_time == 60 + 90 + 20
+
+
+@pytest.mark.parametrize("strategy", ["first_fit_decreasing", "best_fit", "similar_time"])
+@pytest.mark.parametrize("seed", range(3))
+def test_packing_strategies_respect_constraints(strategy, seed):
+    rng = random.Random(seed)
+    jobs = _random_jobs(rng, 300) + [{"id": "BIG", "volume": 999, "priority": 2, "print_time": 5}]
+    constraints = {"max_volume": 300, "max_items": 3}
+    res = optimize_printing(jobs, constraints, strategy=strategy)
+    by_id = {job["id"]: job for job in jobs}
+    assert sorted(res["print_order"]) == sorted(by_id)
+    priorities = [by_id[i]["priority"] for i in res["print_order"]]
+    assert priorities == sorted(priorities)
+
+    cons = PrinterConstraints(**constraints)
+    tier = [PrintJob(**job) for job in jobs if job["priority"] == 2]
+    groups = _PACKING_STRATEGIES[strategy](tier, cons)
+    assert sorted(job.id for group in groups for job in group) == sorted(job.id for job in tier)
+    for group in groups:
+        assert len(group) <= cons.max_items
+        assert len(group) == 1 or sum(job.volume for job in group) <= cons.max_volume
+
+
+def test_first_fit_decreasing_fills_gaps():
+    jobs = [
+        {"id": "A", "volume": 200, "priority": 1, "print_time": 100},
+        {"id": "B", "volume": 200, "priority": 1, "print_time": 100},
+        {"id": "C", "volume": 100, "priority": 1, "print_time": 100},
+        {"id": "D", "volume": 100, "priority": 1, "print_time": 100},
+    ]
+    constraints = {"max_volume": 300, "max_items": 2}
+    assert optimize_printing(jobs, constraints)["total_time"] == 300
+    for strategy in ("first_fit_decreasing", "best_fit"):
+        res = optimize_printing(jobs, constraints, strategy=strategy)
+        assert res["total_time"] == 200
+        assert res["print_order"] == ["A", "C", "B", "D"]
+
+
+def test_similar_time_groups_long_jobs_together():
+    jobs = [
+        {"id": "S1", "volume": 10, "priority": 1, "print_time": 10},
+        {"id": "L1", "volume": 10, "priority": 1, "print_time": 100},
+        {"id": "S2", "volume": 10, "priority": 1, "print_time": 10},
+        {"id": "L2", "volume": 10, "priority": 1, "print_time": 100},
+    ]
+    constraints = {"max_volume": 300, "max_items": 2}
+    assert optimize_printing(jobs, constraints)["total_time"] == 200
+    res = optimize_printing(jobs, constraints, strategy="similar_time")
+    assert res == {"print_order": ["L1", "L2", "S1", "S2"], "total_time": 110}
+
+
+def test_unknown_strategy(jobs_same_priority, printing_constraints):
+    with pytest.raises(ValueError):
+        optimize_printing(jobs_same_priority, printing_constraints, strategy="worst_fit")
+
+
+def test_multi_single_printer_equals_total_time():
+    jobs = _random_jobs(random.Random(21), 100)
+    constraints = {"max_volume": 300, "max_items": 3}
+    res = optimize_printing_multi(jobs, constraints, num_printers=1)
+    expected = optimize_printing(jobs, constraints)
+    assert res["makespan"] == res["total_time"] == expected["total_time"]
+    assert sorted(res["printers"][0]) == sorted(expected["print_order"])
+
+
+def test_multi_lpt_within_priority():
+    jobs = [{"id": f"J{t}", "volume": 1, "priority": 1, "print_time": t} for t in (2, 3, 7, 5, 4, 3)]
+    res = optimize_printing_multi(jobs, {"max_volume": 10, "max_items": 1}, num_printers=2)
+    # LPT: 7 | 5 | 4 -> друге | 3 -> друге | 3 | 2
+    assert res["printers"] == [["J7", "J3", "J2"], ["J5", "J4", "J3"]]
+    assert res["makespan"] == 12 and res["total_time"] == 24
+
+
+def test_multi_keeps_priority_order():
+    rng = random.Random(22)
+    jobs = _random_jobs(rng, 200)
+    by_id = {job["id"]: job for job in jobs}
+    res = optimize_printing_multi(jobs, {"max_volume": 1, "max_items": 1},
+                                  num_printers=4, strategy="similar_time")
+    assert sorted(i for order in res["printers"] for i in order) == sorted(by_id)
+    starts = {}
+    for order in res["printers"]:
+        clock = 0
+        for job_id in order:
+            starts[job_id] = clock
+            clock += by_id[job_id]["print_time"]
+    last_start = {p: max(starts[i] for i in starts if by_id[i]["priority"] == p) for p in (1, 2)}
+    first_start = {p: min(starts[i] for i in starts if by_id[i]["priority"] == p) for p in (2, 3)}
+    assert last_start[1] <= first_start[2] and last_start[2] <= first_start[3]
+    assert res["makespan"] < res["total_time"]
+    with pytest.raises(ValueError):
+        optimize_printing_multi(jobs, {"max_volume": 1, "max_items": 1}, num_printers=0)
+
+
+def test_print_job_has_slots():
+    job = PrintJob("M1", 100, 1, 120)
+    assert not hasattr(job, "__dict__")
+    with pytest.raises(AttributeError):
+        job.color = "red"
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "csv"])
+def test_columnar_loader_and_optimizer(tmp_path, fmt):
+    jobs = _random_jobs(random.Random(31), 500)
+    path = tmp_path / f"jobs.{fmt}"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "jsonl":
+            f.writelines(json.dumps(job) + "\n" for job in jobs)
+        else:
+            writer = csv.DictWriter(f, fieldnames=["id", "volume", "priority", "print_time"])
+            writer.writeheader()
+            writer.writerows(jobs)
+    columns = load_print_jobs(str(path))
+    assert len(columns) == 500 and columns.volume.typecode == "d"
+    assert columns[7] == PrintJob(**jobs[7])
+    constraints = {"max_volume": 300, "max_items": 3}
+    for strategy in ("greedy", "best_fit"):
+        assert (optimize_printing(columns, constraints, strategy=strategy) ==
+                optimize_printing(jobs, constraints, strategy=strategy))
+    assert (optimize_printing_multi(columns, constraints, num_printers=3) ==
+            optimize_printing_multi(jobs, constraints, num_printers=3))
+
+
+def test_job_columns_records_and_bad_format():
+    columns = JobColumns.from_records([{"id": 1, "volume": "2.5", "priority": "1", "print_time": 30}])
+    assert list(columns) == [PrintJob("1", 2.5, 1, 30)]
+    with pytest.raises(ValueError):
+        load_print_jobs("jobs.xml")
+
+
+def test_job_columns_fractional_print_time():
+    jobs = [{"id": "A", "volume": 100, "priority": 1, "print_time": 30.5},
+            {"id": "B", "volume": 450, "priority": 1, "print_time": 12.25}]
+    constraints = {"max_volume": 500, "max_items": 3}
+    columns = JobColumns.from_records(jobs)
+    assert optimize_printing(columns, constraints) == optimize_printing(jobs, constraints)
+    assert optimize_printing(columns, constraints)["total_time"] == 42.75
+
+
 # Test data for rod cutting
 @pytest.mark.parametrize("length,prices,expected_profit,expected_cuts", [
     (5, [2, 5, 7, 8, 10], 12, [2, 2, 1]),
@@ -75,5 +270,120 @@ def test_rod_cutting_methods(length, prices, expected_profit, expected_cuts):
     assert table_res["cuts"] == expected_cuts
     assert table_res["number_of_cuts"] == max(0, len(expected_cuts) - 1)
 
+
+@pytest.mark.parametrize("seed", range(5))
+def test_rod_cutting_table_matches_list_reference(seed):
+    rng = random.Random(seed)
+    length = rng.randint(0, 60)
+    prices = [rng.randint(0, 30) for _ in range(length)]
+    profit, cuts = _rod_cutting_lists(length, prices)
+    res = rod_cutting_table(length, prices)
+    assert (res["max_profit"], res["cuts"]) == (profit, cuts)
+
+
+def test_rod_cutting_batch_matches_single_queries():
+    rng = random.Random(12)
+    prices = [rng.randint(1, 40) for _ in range(80)]
+    lengths = [rng.randint(0, 80) for _ in range(50)] + [80, 0, 80]
+    results = rod_cutting_batch(lengths, prices)
+    assert results == [rod_cutting_table(length, prices) for length in lengths]
+
+
+def test_rod_cutting_batch_edge_cases():
+    assert rod_cutting_batch([], [1, 2]) == []
+    with pytest.raises(ValueError):
+        rod_cutting_batch([2, -1], [1, 2])
+
+
+def _bounded_brute_force(length, prices, cut_cost, max_counts):
+    best = 0
+    ranges = [range(min(c, length // (i + 1)) + 1) for i, c in enumerate(max_counts)]
+    for counts in itertools.product(*ranges):
+        used = sum(c * (i + 1) for i, c in enumerate(counts))
+        pieces = sum(counts)
+        if used > length or pieces == 0:
+            continue
+        cuts = pieces - 1 if used == length else pieces
+        best = max(best, sum(c * p for c, p in zip(counts, prices)) - cut_cost * cuts)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rod_cutting_bounded_matches_brute_force(seed):
+    rng = random.Random(seed)
+    length = rng.randint(1, 9)
+    prices = [rng.randint(0, 12) for _ in range(rng.randint(1, 6))]
+    max_counts = [rng.randint(0, 3) for _ in prices]
+    cut_cost = rng.choice([0, 1, 3])
+    res = rod_cutting_bounded(length, prices, cut_cost=cut_cost, max_counts=max_counts)
+    assert res["max_profit"] == _bounded_brute_force(length, prices, cut_cost, max_counts)
+    # Розрізи узгоджені з прибутком і обмеженнями
+    used = sum(res["cuts"])
+    assert used + res["waste"] == length
+    assert all(res["cuts"].count(i + 1) <= c for i, c in enumerate(max_counts))
+    paid = sum(prices[c - 1] for c in res["cuts"]) - cut_cost * res["number_of_cuts"]
+    assert paid == res["max_profit"]
+
+
+def test_rod_cutting_bounded_unlimited_matches_table():
+    rng = random.Random(40)
+    prices = [rng.randint(1, 60) for _ in range(60)]
+    res = rod_cutting_bounded(60, prices)
+    assert res["max_profit"] == rod_cutting_table(60, prices)["max_profit"]
+    assert res["waste"] == 0
+    with pytest.raises(ValueError):
+        rod_cutting_bounded(5, [1, 2], max_counts=[1])
+
+
+def test_rod_cutting_memo_long_rod_no_recursion_limit():
+    prices = [random.Random(11).randint(1, 5000) for _ in range(3000)]
+    memo = RodCuttingMemo()
+    res = rod_cutting_memo(3000, prices, memo=memo)
+    assert res == rod_cutting_table(3000, prices)
+
+
+def test_rod_cutting_memo_reuses_tables():
+    memo = RodCuttingMemo(max_tables=2)
+    prices = [2, 5, 7, 8, 10, 17]
+    assert memo.solve(3, prices)["max_profit"] == 7
+    table = memo.table(prices)
+    assert len(table.dp) == 4
+    assert memo.solve(6, prices) == rod_cutting_table(6, prices)
+    assert memo.solve(5, prices)["cuts"] == [2, 2, 1]
+    assert len(table.dp) == 7
+    info = memo.cache_info()
+    assert (info["hits"], info["misses"], info["tables"]) == (3, 1, 1)
+
+
+def test_rod_cutting_memo_lru_eviction():
+    memo = RodCuttingMemo(max_tables=2)
+    a, b, c = [1, 5], [2, 3], [3, 1]
+    memo.solve(2, a)
+    memo.solve(2, b)
+    memo.solve(2, a)  # a стає найсвіжішою
+    memo.solve(2, c)  # витісняє b
+    memo.solve(2, a)
+    memo.solve(2, b)
+    assert memo.cache_info()["misses"] == 4
+    memo.clear()
+    assert memo.cache_info() == {"hits": 0, "misses": 0, "tables": 0, "max_tables": 2}
+    with pytest.raises(ValueError):
+        RodCuttingMemo(max_tables=0)
+
+
+@pytest.mark.parametrize("length,prices", [
+    (5, [2, 5, 7, 8, 10]),
+    (4, [3, 5, 6, 7]),
+    (3, [0, 0, 0]),
+    (40, [random.Random(9).randint(1, 90) for _ in range(40)]),
+    (25, [random.Random(10).uniform(0, 20) for _ in range(25)]),
+])
+def test_rod_cutting_table_numpy(length, prices):
+    pytest.importorskip("numpy")
+    expected = rod_cutting_table(length, prices)
+    res = rod_cutting_table(length, prices, use_numpy=True)
+    assert res["cuts"] == expected["cuts"]
+    assert res["max_profit"] == pytest.approx(expected["max_profit"])
+
 if __name__ == "__main__":
     pytest.main(["-q"])
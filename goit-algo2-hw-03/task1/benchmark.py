@@ -0,0 +1,87 @@
+"""
+Max-flow benchmarks on synthetic layered logistics networks.
+"""
+import random
+import sys
+import time
+
+from csr_network import CSRFlowNetwork
+from solution import FlowNetwork
+
+
+def layered_edges(layers, width, degree, max_cap=100, seed=None):
+    """
+    Edges of a layered network: 'source' -> layer 0 -> ... -> last layer -> 'sink',
+    each node linked to `degree` random nodes of the next layer.
+    """
+    rng = random.Random(seed)
+    edges = [('source', (0, i), rng.randint(1, max_cap) * degree) for i in range(width)]
+    for layer in range(layers - 1):
+        for i in range(width):
+            for j in rng.sample(range(width), degree):
+                edges.append(((layer, i), (layer + 1, j), rng.randint(1, max_cap)))
+    edges += [((layers - 1, i), 'sink', rng.randint(1, max_cap) * degree) for i in range(width)]
+    return edges
+
+
+def benchmark_max_flow(configs, skip_edmonds_karp_above=20_000):
+    print(f"{'nodes':>8} {'edges':>8} {'algorithm':<16} {'flow':>10} {'build':>8} {'solve':>9}")
+    for layers, width, degree in configs:
+        edges = layered_edges(layers, width, degree, seed=layers * width)
+        results = set()
+        for algorithm in ("edmonds_karp", "dinic", "push_relabel"):
+            if algorithm == "edmonds_karp" and len(edges) > skip_edmonds_karp_above:
+                print(f"{layers * width + 2:>8} {len(edges):>8} {algorithm:<16} {'skipped':>10}")
+                continue
+            start = time.perf_counter()
+            net = FlowNetwork()
+            for u, v, w in edges:
+                net.add_edge(u, v, w)
+            built = time.perf_counter()
+            flow = net.max_flow('source', 'sink', algorithm=algorithm)
+            solved = time.perf_counter()
+            results.add(flow)
+            print(f"{layers * width + 2:>8} {len(edges):>8} {algorithm:<16} {flow:>10} "
+                  f"{built - start:>7.2f}s {solved - built:>8.2f}s")
+        for algorithm in ("dinic", "push_relabel"):
+            start = time.perf_counter()
+            graph = CSRFlowNetwork.from_edges(edges)
+            built = time.perf_counter()
+            flow = graph.max_flow('source', 'sink', algorithm=algorithm)
+            solved = time.perf_counter()
+            results.add(flow)
+            print(f"{layers * width + 2:>8} {len(edges):>8} {'csr/' + algorithm:<16} {flow:>10} "
+                  f"{built - start:>7.2f}s {solved - built:>8.2f}s")
+        assert len(results) == 1
+
+
+def benchmark_min_cost_flow(configs, max_cost=20):
+    """Successive shortest paths on layered networks with random per-edge costs."""
+    print(f"\n{'nodes':>8} {'edges':>8} {'flow':>10} {'cost':>12} {'max_flow':>9} {'min_cost':>9}")
+    for layers, width, degree in configs:
+        rng = random.Random(layers + width)
+        edges = [(u, v, w, rng.randint(1, max_cost))
+                 for u, v, w in layered_edges(layers, width, degree, seed=layers * width)]
+        graph = CSRFlowNetwork.from_edges(edges, costs=True)
+        start = time.perf_counter()
+        flow = graph.max_flow('source', 'sink')
+        solved = time.perf_counter()
+        graph.reset()
+        min_flow, cost = graph.min_cost_max_flow('source', 'sink')
+        done = time.perf_counter()
+        assert min_flow == flow
+        print(f"{layers * width + 2:>8} {len(edges):>8} {flow:>10} {cost:>12} "
+              f"{solved - start:>8.2f}s {done - solved:>8.2f}s")
+
+
+if __name__ == "__main__":
+    configs = [(10, 100, 3), (20, 500, 3), (50, 1000, 3)]
+    # terminals -> warehouses -> shops style: ~10^4 edges
+    cost_configs = [(3, 1700, 2)]
+    if "--full" in sys.argv:
+        # ~10^5 nodes
+        configs.append((100, 1000, 3))
+        # ~4 * 10^4 and ~10^5 edges
+        cost_configs += [(3, 5000, 3), (4, 8000, 3)]
+    benchmark_max_flow(configs)
+    benchmark_min_cost_flow(cost_configs)
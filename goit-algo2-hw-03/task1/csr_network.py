@@ -0,0 +1,406 @@
+"""
+Compact integer-indexed flow network in CSR (compressed sparse row) form,
+with Dinic and FIFO push-relabel max-flow solvers running on it, and a
+min-cost max-flow solver (successive shortest paths) for networks with costs.
+"""
+import heapq
+from array import array
+from collections import deque
+
+
+def _typecode(capacities):
+    return "l" if all(isinstance(c, int) for c in capacities) else "d"
+
+
+class CSRFlowNetwork:
+    """
+    Node names are interned to 0..n-1. Every edge u->v becomes a pair of
+    arcs: the forward arc with its capacity and a reverse arc with capacity 0.
+    The arcs leaving node u are offsets[u]..offsets[u + 1] - 1; for arc a,
+    tail[a] -> head[a] is its direction, cap[a] its residual capacity
+    (updated in place by the solvers), capacity[a] the original capacity
+    and rev[a] the index of the paired arc. A network built with costs also
+    has cost[a] per unit of flow (the reverse arc has the negated cost).
+    """
+
+    def __init__(self, nodes, offsets, tail, head, capacity, rev, cost=None):
+        self.nodes = nodes
+        self.index = {node: i for i, node in enumerate(nodes)}
+        self.n = len(nodes)
+        self.offsets = offsets
+        self.tail = tail
+        self.head = head
+        self.capacity = capacity
+        self.cap = array(capacity.typecode, capacity)
+        self.rev = rev
+        self.cost = cost
+
+    @classmethod
+    def from_edges(cls, edges, costs=False):
+        """
+        Builds the network from an iterable of (u, v, capacity) in one pass
+        plus a counting sort of the arcs by tail; no per-edge adjacency scans.
+        Parallel edges are kept as separate arcs.
+        With costs=True the items are (u, v, capacity, cost).
+        """
+        index = {}
+        nodes = []
+        eu, ev, ec, ew = array("l"), array("l"), [], []
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            for node in (u, v):
+                if node not in index:
+                    index[node] = len(nodes)
+                    nodes.append(node)
+            eu.append(index[u])
+            ev.append(index[v])
+            ec.append(edge[2])
+            if costs:
+                ew.append(edge[3])
+        return cls._build(nodes, eu, ev, array(_typecode(ec), ec),
+                          ew=array(_typecode(ew), ew) if costs else None)
+
+    @classmethod
+    def _build(cls, nodes, eu, ev, ec, rc=None, ew=None):
+        """
+        Arc pairs for edges eu[i] -> ev[i] with capacity ec[i] (reverse
+        capacity rc[i] or 0) and, if given, cost ew[i].
+        """
+        n, m = len(nodes), len(eu)
+        offsets = array("l", [0]) * (n + 1)
+        for i in range(m):
+            offsets[eu[i] + 1] += 1
+            offsets[ev[i] + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        pos = array("l", offsets)
+        size = 2 * m
+        tail = array("l", [0]) * size
+        head = array("l", tail)
+        rev = array("l", tail)
+        capacity = array(ec.typecode, [0]) * size
+        cost = None if ew is None else array(ew.typecode, [0]) * size
+        for i in range(m):
+            u, v = eu[i], ev[i]
+            a, b = pos[u], pos[v]
+            pos[u] += 1
+            pos[v] += 1
+            tail[a], head[a], capacity[a], rev[a] = u, v, ec[i], b
+            tail[b], head[b], rev[b] = v, u, a
+            if rc is not None:
+                capacity[b] = rc[i]
+            if cost is not None:
+                cost[a], cost[b] = ew[i], -ew[i]
+        return cls(nodes, offsets, tail, head, capacity, rev, cost)
+
+    @classmethod
+    def from_flow_network(cls, net):
+        """
+        Snapshot of a dict-based FlowNetwork: one arc pair per adjacent node
+        pair, with the current residual capacities in both directions.
+        """
+        nodes = list(net.neighbors)
+        index = {node: i for i, node in enumerate(nodes)}
+        eu, ev, ec, rc = array("l"), array("l"), [], []
+        for u in nodes:
+            row = net.capacities[u]
+            for v in net.neighbors[u]:
+                if index[u] < index[v]:
+                    eu.append(index[u])
+                    ev.append(index[v])
+                    ec.append(row.get(v, 0))
+                    rc.append(net.capacities[v].get(u, 0))
+        typecode = _typecode(ec + rc)
+        return cls._build(nodes, eu, ev, array(typecode, ec), array(typecode, rc))
+
+    def write_back(self, net):
+        """Copies residual capacities back into a dict-based FlowNetwork."""
+        nodes, tail, head, cap = self.nodes, self.tail, self.head, self.cap
+        for a in range(len(cap)):
+            net.capacities[nodes[tail[a]]][nodes[head[a]]] = cap[a]
+
+    def reset(self):
+        """Restores residual capacities to the original ones (zero flow)."""
+        self.cap = array(self.capacity.typecode, self.capacity)
+
+    def max_flow(self, source, sink, algorithm="dinic"):
+        """
+        Maximum flow from source to sink; residual capacities stay in self.cap,
+        so calling it again continues from the current flow.
+        algorithm: "dinic" or "push_relabel".
+        """
+        if algorithm not in SOLVERS:
+            raise ValueError(f"Unknown max-flow algorithm: {algorithm}")
+        if source not in self.index or sink not in self.index or source == sink:
+            return 0
+        return SOLVERS[algorithm](self, self.index[source], self.index[sink])
+
+    def min_cost_max_flow(self, source, sink):
+        """
+        Maximum flow of minimum total cost from source to sink, starting
+        from the current flow (normally zero: call reset() first).
+        Requires a network built with costs and no negative-cost cycles.
+        :return: tuple (flow, cost)
+        """
+        if self.cost is None:
+            raise ValueError("Network has no costs: build it with from_edges(..., costs=True)")
+        if source not in self.index or sink not in self.index or source == sink:
+            return 0, 0
+        return _successive_shortest_paths(self, self.index[source], self.index[sink])
+
+    def edge_flows(self):
+        """(u, v, capacity, flow) for every edge with positive capacity."""
+        nodes, tail, head, capacity, cap = self.nodes, self.tail, self.head, self.capacity, self.cap
+        for a in range(len(cap)):
+            if capacity[a] > 0:
+                yield nodes[tail[a]], nodes[head[a]], capacity[a], capacity[a] - cap[a]
+
+
+def _dinic(g, s, t):
+    """
+    Dinic: BFS level graph, then a blocking flow found by iterative DFS
+    with current-arc pointers (each arc is skipped at most once per phase).
+    O(V^2 E).
+    """
+    return _blocking_flows(g, s, t)[0]
+
+
+def _blocking_flows(g, s, t, pot=None, eps=0):
+    """
+    Dinic phases until t is unreachable. With potentials, only arcs of zero
+    reduced cost (cost[a] + pot[u] - pot[v] <= eps) are admissible, so every
+    augmenting path is a shortest path, and the cost of the flow is tracked.
+    :return: tuple (flow, cost) of what was pushed (cost is 0 without pot)
+    """
+    offsets, head, cap, cost, rev, n = g.offsets, g.head, g.cap, g.cost, g.rev, g.n
+    plain = pot is None
+    flow = total_cost = 0
+    while True:
+        level = [-1] * n
+        level[s] = 0
+        queue = deque([s])
+        while queue:
+            u = queue.popleft()
+            pu = 0 if plain else pot[u]
+            for a in range(offsets[u], offsets[u + 1]):
+                v = head[a]
+                if cap[a] > 0 and level[v] < 0 and (plain or cost[a] + pu - pot[v] <= eps):
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        if level[t] < 0:
+            return flow, total_cost
+
+        it = list(offsets[:n])
+        path = []
+        u = s
+        while True:
+            if u == t:
+                pushed = min(cap[a] for a in path)
+                for a in path:
+                    cap[a] -= pushed
+                    cap[rev[a]] += pushed
+                if not plain:
+                    total_cost += pushed * sum(cost[a] for a in path)
+                flow += pushed
+                # retreat to the tail of the first saturated arc
+                for i, a in enumerate(path):
+                    if cap[a] == 0:
+                        del path[i:]
+                        break
+                u = head[path[-1]] if path else s
+                continue
+            end = offsets[u + 1]
+            a = it[u]
+            next_level = level[u] + 1
+            pu = 0 if plain else pot[u]
+            while a < end:
+                v = head[a]
+                if cap[a] > 0 and level[v] == next_level and (plain or cost[a] + pu - pot[v] <= eps):
+                    break
+                a += 1
+            it[u] = a
+            if a == end:
+                # dead end: drop u from the level graph and retreat
+                if u == s:
+                    break
+                level[u] = -1
+                a = path.pop()
+                u = head[rev[a]]
+                it[u] += 1
+                continue
+            path.append(a)
+            u = head[a]
+
+
+def _push_relabel(g, s, t):
+    """
+    FIFO push-relabel with the gap heuristic and periodic global relabeling
+    (exact distance labels by reverse BFS from the sink, then the source).
+    O(V^3) worst case, usually much faster on large sparse graphs.
+    """
+    offsets, head, cap, rev, n = g.offsets, g.head, g.cap, g.rev, g.n
+    height = [0] * n
+    excess = [0] * n
+    count = [0] * (2 * n + 2)
+    cur = list(offsets[:n])
+    active = deque()
+    in_queue = [False] * n
+
+    def global_relabel():
+        for i in range(n):
+            height[i] = 2 * n
+        for root, base in ((t, 0), (s, n)):
+            if height[root] < 2 * n:
+                continue
+            height[root] = base
+            queue = deque([root])
+            while queue:
+                v = queue.popleft()
+                for a in range(offsets[v], offsets[v + 1]):
+                    u = head[a]
+                    if height[u] == 2 * n and cap[rev[a]] > 0 and u != s:
+                        height[u] = height[v] + 1
+                        queue.append(u)
+        height[s] = n
+        for i in range(len(count)):
+            count[i] = 0
+        for i in range(n):
+            count[height[i]] += 1
+            cur[i] = offsets[i]
+
+    height[s] = n
+    for a in range(offsets[s], offsets[s + 1]):
+        pushed = cap[a]
+        if pushed > 0:
+            v = head[a]
+            cap[a] -= pushed
+            cap[rev[a]] += pushed
+            excess[v] += pushed
+            excess[s] -= pushed
+            if v != t and v != s and not in_queue[v]:
+                in_queue[v] = True
+                active.append(v)
+    global_relabel()
+
+    relabels = 0
+    while active:
+        u = active.popleft()
+        in_queue[u] = False
+        end = offsets[u + 1]
+        while excess[u] > 0:
+            if cur[u] == end:
+                # relabel
+                old = height[u]
+                new = 2 * n
+                for a in range(offsets[u], end):
+                    if cap[a] > 0 and height[head[a]] + 1 < new:
+                        new = height[head[a]] + 1
+                count[old] -= 1
+                height[u] = new
+                count[new] += 1
+                cur[u] = offsets[u]
+                relabels += 1
+                if count[old] == 0 and old < n:
+                    # gap: nodes above it can no longer reach the sink
+                    for w in range(n):
+                        if old < height[w] < n:
+                            count[height[w]] -= 1
+                            height[w] = n + 1
+                            count[n + 1] += 1
+                if height[u] >= 2 * n:
+                    break
+                if relabels >= n:
+                    relabels = 0
+                    global_relabel()
+                continue
+            a = cur[u]
+            v = head[a]
+            if cap[a] > 0 and height[u] == height[v] + 1:
+                pushed = min(excess[u], cap[a])
+                cap[a] -= pushed
+                cap[rev[a]] += pushed
+                excess[u] -= pushed
+                excess[v] += pushed
+                if v != s and v != t and not in_queue[v]:
+                    in_queue[v] = True
+                    active.append(v)
+            else:
+                cur[u] += 1
+    return excess[t]
+
+
+def _bellman_ford(g, s):
+    """
+    Shortest distances from s over arcs with residual capacity (SPFA),
+    used as the initial potentials when some costs are negative.
+    """
+    offsets, head, cap, cost, n = g.offsets, g.head, g.cap, g.cost, g.n
+    dist = [0] * n
+    reached = [False] * n
+    reached[s] = True
+    queue = deque([s])
+    in_queue = [False] * n
+    in_queue[s] = True
+    relaxed = [0] * n
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = False
+        for a in range(offsets[u], offsets[u + 1]):
+            v = head[a]
+            if cap[a] > 0 and (not reached[v] or dist[u] + cost[a] < dist[v]):
+                reached[v] = True
+                dist[v] = dist[u] + cost[a]
+                if not in_queue[v]:
+                    relaxed[v] += 1
+                    if relaxed[v] > n:
+                        raise ValueError("Network has a negative-cost cycle")
+                    in_queue[v] = True
+                    queue.append(v)
+    return dist
+
+
+def _successive_shortest_paths(g, s, t):
+    """
+    Min-cost max-flow by successive shortest paths. Johnson potentials keep
+    the reduced costs cost[a] + pot[u] - pot[v] non-negative, so shortest
+    paths are found by Dijkstra with a binary heap. After each Dijkstra the
+    potentials are shifted by the distances, and all shortest paths of that
+    length are augmented at once by a blocking flow over the zero-reduced-
+    cost arcs. O(F * E log V) worst case for total flow F, in practice the
+    number of Dijkstra runs is the number of distinct path costs.
+    """
+    offsets, head, cap, cost, n = g.offsets, g.head, g.cap, g.cost, g.n
+    if any(cost[a] < 0 for a in range(len(cap)) if cap[a] > 0):
+        pot = _bellman_ford(g, s)
+    else:
+        pot = [0] * n
+    eps = 0 if cost.typecode == "l" else 1e-9
+    inf = float("inf")
+    flow = total_cost = 0
+    while True:
+        dist = [inf] * n
+        dist[s] = 0
+        heap = [(0, s)]
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            base = d + pot[u]
+            for a in range(offsets[u], offsets[u + 1]):
+                if cap[a] > 0:
+                    v = head[a]
+                    nd = base + cost[a] - pot[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        heapq.heappush(heap, (nd, v))
+        if dist[t] == inf:
+            return flow, total_cost
+        for v in range(n):
+            if dist[v] < inf:
+                pot[v] += dist[v]
+        pushed, pushed_cost = _blocking_flows(g, s, t, pot, eps)
+        flow += pushed
+        total_cost += pushed_cost
+
+
+SOLVERS = {"dinic": _dinic, "push_relabel": _push_relabel}
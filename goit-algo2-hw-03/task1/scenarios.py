@@ -0,0 +1,99 @@
+"""
+Parallel what-if analysis: which single-route capacity change raises the
+maximum flow the most.
+
+The base network is solved once in the parent and sent to every worker
+process once (pool initializer). Each worker then answers its scenarios
+incrementally on that solved network: update_capacity applies the change
+starting from the base flow, and a second update_capacity restores the
+base capacity, so no scenario copies or re-solves the whole network.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# The solved base network of this worker process
+_base = None
+
+
+def _init_worker(net):
+    global _base
+    _base = net
+
+
+def _evaluate(net, upgrade):
+    u, v, delta = upgrade
+    old = net.original_capacities.get((u, v), 0)
+    new = max(old + delta, 0)
+    flow = net.update_capacity(u, v, new)
+    net.update_capacity(u, v, old)
+    return u, v, delta, new, flow
+
+
+def _evaluate_in_worker(upgrade):
+    return _evaluate(_base, upgrade)
+
+
+def rank_upgrades(net, sources, sinks, upgrades, workers=None, algorithm="edmonds_karp"):
+    """
+    Max flow after each capacity change, best gain first.
+    :param net: FlowNetwork; its base flow is computed here (if it has no
+                flow between these terminals yet) and left in it
+    :param sources: source node or list/set of nodes, as in max_flow
+    :param sinks: sink node or list/set of nodes
+    :param upgrades: iterable of (u, v, delta); a missing edge is added,
+                     a negative delta models a cut (capacity stops at 0)
+    :param workers: number of processes (default: os.cpu_count()); 1 runs
+                    the scenarios in this process
+    :param algorithm: max-flow algorithm for the base solve and the repairs
+    :return: list of dicts with "edge", "delta", "capacity", "max_flow" and
+             "gain", sorted by gain (descending), ties in input order
+    """
+    upgrades = list(upgrades)
+    net.max_flow(sources, sinks, algorithm=algorithm)
+    base = net.flow_value
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(upgrades) < 2:
+        results = [_evaluate(net, upgrade) for upgrade in upgrades]
+    else:
+        chunk = max(1, len(upgrades) // (workers * 4))
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(net,)) as pool:
+            results = list(pool.map(_evaluate_in_worker, upgrades, chunksize=chunk))
+    table = [{"edge": (u, v), "delta": delta, "capacity": capacity,
+              "max_flow": flow, "gain": flow - base}
+             for u, v, delta, capacity, flow in results]
+    table.sort(key=lambda row: -row["gain"])
+    return table
+
+
+def format_table(table, limit=None):
+    """Ranked scenario table as text."""
+    lines = [f"{'route':<16} {'delta':>6} {'capacity':>9} {'max flow':>9} {'gain':>6}"]
+    for row in table[:limit]:
+        u, v = row["edge"]
+        lines.append(f"{f'{u}->{v}':<16} {row['delta']:>6} {row['capacity']:>9} "
+                     f"{row['max_flow']:>9} {row['gain']:>6}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from solution import FlowNetwork, load_flow_network
+
+    if len(sys.argv) > 1:
+        net = load_flow_network(sys.argv[1])
+    else:
+        net = FlowNetwork.from_edges([
+            ('T1', 'S1', 25), ('T1', 'S2', 20), ('T1', 'S3', 15),
+            ('T2', 'S3', 15), ('T2', 'S4', 30), ('T2', 'S2', 10),
+            ('S1', 'M1', 15), ('S1', 'M2', 10), ('S1', 'M3', 20),
+            ('S2', 'M4', 15), ('S2', 'M5', 10), ('S2', 'M6', 25),
+            ('S3', 'M7', 20), ('S3', 'M8', 15), ('S3', 'M9', 10),
+            ('S4', 'M10', 20), ('S4', 'M11', 10), ('S4', 'M12', 15),
+            ('S4', 'M13', 5), ('S4', 'M14', 10),
+        ])
+    terminals = [n for n in net.neighbors if n.startswith('T')]
+    shops = [n for n in net.neighbors if n.startswith('M')]
+    routes = list(net.original_capacities)
+    table = rank_upgrades(net, terminals, shops, [(u, v, 10) for u, v in routes])
+    print(f"Base max flow: {net.flow_value}; every route +10:")
+    print(format_table(table, limit=10))
@@ -1,25 +1,58 @@
 """
-Edmonds-Karp implementation for maximum flow in a logistics network.
+Maximum flow in a logistics network: Edmonds-Karp, Dinic and FIFO push-relabel.
 """
+import csv
+import json
+import sys
 from collections import deque, defaultdict
 
+from csr_network import CSRFlowNetwork, SOLVERS
+
+# Internal terminals wired by max_flow when given several sources or sinks
+SUPER_SOURCE = "super_source"
+SUPER_SINK = "super_sink"
+
 class FlowNetwork:
     def __init__(self):
         # capacities[u][v] = capacity from u to v
         self.capacities = defaultdict(dict)
         self.neighbors = defaultdict(list)
+        # original_capacities[(u, v)] = capacity as added (not residual)
+        self.original_capacities = {}
+        # costs[(u, v)] = cost per unit of flow, used by min_cost_max_flow
+        self.costs = {}
+        # terminals, value and algorithm of the current flow, for update_capacity
+        self.source = self.sink = self.algorithm = None
+        self.flow_value = 0
+        # terminal sets currently wired to SUPER_SOURCE / SUPER_SINK
+        self.terminals = (frozenset(), frozenset())
+
+    @classmethod
+    def from_edges(cls, edges):
+        """
+        Builds a network in one pass over an iterable of (u, v, capacity)
+        or (u, v, capacity, cost), e.g. a file loader's generator.
+        """
+        net = cls()
+        add_edge = net.add_edge
+        for edge in edges:
+            add_edge(*edge)
+        return net
 
-    def add_edge(self, u, v, w):
+    def add_edge(self, u, v, w, cost=0):
+        # capacities[u] has v exactly when u and v are already neighbors,
+        # so this O(1) check replaces a scan of the neighbor list
+        if v not in self.capacities[u]:
+            # track neighbors for BFS
+            self.neighbors[u].append(v)
+            if u != v:
+                self.neighbors[v].append(u)
         # add forward edge
         self.capacities[u][v] = w
+        self.original_capacities[(u, v)] = w
+        self.costs[(u, v)] = cost
         # initialize reverse edge capacity to 0 if not exists
-        if v not in self.capacities or u not in self.capacities[v]:
-            self.capacities[v].setdefault(u, 0)
-        # track neighbors for BFS
-        if v not in self.neighbors[u]:
-            self.neighbors[u].append(v)
-        if u not in self.neighbors[v]:
-            self.neighbors[v].append(u)
+        self.capacities[v].setdefault(u, 0)
 
     def bfs(self, source, sink, parent):
         visited = set()
@@ -37,13 +70,14 @@ class FlowNetwork:
                     queue.append(v)
         return False
 
-    def edmonds_karp(self, source, sink):
+    def _augment(self, source, sink, limit=float('inf')):
+        """Pushes up to `limit` units along shortest residual paths (BFS)."""
         parent = {}
-        max_flow = 0
+        pushed = 0
         # residual capacities are stored in capacities
-        while self.bfs(source, sink, parent):
+        while pushed < limit and self.bfs(source, sink, parent):
             # find bottleneck
-            path_flow = float('inf')
+            path_flow = limit - pushed
             s = sink
             while s != source:
                 path_flow = min(path_flow, self.capacities[parent[s]][s])
@@ -55,72 +89,414 @@ class FlowNetwork:
                 self.capacities[u][v] -= path_flow
                 self.capacities[v][u] += path_flow
                 v = u
-            max_flow += path_flow
-        return max_flow
+            pushed += path_flow
+        return pushed
+
+    def _record(self, source, sink, algorithm, flow):
+        # a repeated solve for the same terminals continues the current flow
+        if (source, sink) == (self.source, self.sink):
+            self.flow_value += flow
+        else:
+            self.source, self.sink, self.flow_value = source, sink, flow
+        self.algorithm = algorithm
+        return flow
+
+    def edmonds_karp(self, source, sink):
+        return self._record(source, sink, "edmonds_karp", self._augment(source, sink))
+
+    def max_flow(self, sources, sinks, algorithm="edmonds_karp"):
+        """
+        Maximum flow from source to sink; the residual capacities are left
+        in self.capacities, as with edmonds_karp.
+        sources/sinks: a node, or a list/set of nodes; several terminals are
+        joined by SUPER_SOURCE/SUPER_SINK edges sized at each terminal's
+        total capacity, so update_capacity, decompose_flow and min_cut work
+        as usual. A repeated call with the same terminals continues from the
+        current flow; other terminals start over from zero flow.
+        algorithm: "edmonds_karp" (O(VE^2)), "dinic" (O(V^2 E)) or
+        "push_relabel" (FIFO with gap and global relabel heuristics).
+        """
+        source, sink = self._wire_terminals(sources, sinks)
+        return self._solve(source, sink, algorithm)
+
+    def _solve(self, source, sink, algorithm):
+        if algorithm == "edmonds_karp":
+            return self.edmonds_karp(source, sink)
+        if algorithm not in SOLVERS:
+            raise ValueError(f"Unknown max-flow algorithm: {algorithm}")
+        if source not in self.neighbors or sink not in self.neighbors or source == sink:
+            return self._record(source, sink, algorithm, 0)
+        # solve on a compact CSR snapshot, then copy the residuals back
+        graph = CSRFlowNetwork.from_flow_network(self)
+        flow = graph.max_flow(source, sink, algorithm=algorithm)
+        graph.write_back(self)
+        return self._record(source, sink, algorithm, flow)
+
+    def _wire_terminals(self, sources, sinks):
+        """
+        Resolves sources/sinks to the two nodes to solve between. Terminal
+        sets that differ from the last solve reset the flow and rewire the
+        internal edges; the same sets only resize the internal edges to the
+        terminals' current total capacity.
+        """
+        ends = []
+        wanted = []
+        for nodes, name in ((sources, SUPER_SOURCE), (sinks, SUPER_SINK)):
+            if not isinstance(nodes, (list, set, frozenset)):
+                nodes = [nodes]
+            # deduplicated, in the caller's order
+            nodes = list(dict.fromkeys(nodes))
+            if len(nodes) == 1:
+                ends.append(nodes[0])
+                wanted.append([])
+            else:
+                if name in nodes:
+                    raise ValueError(f"{name} is reserved for the internal terminal")
+                ends.append(name)
+                wanted.append(nodes)
+        source, sink = ends
+        if (source, sink) != (self.source, self.sink) or tuple(map(frozenset, wanted)) != self.terminals:
+            if self.source is not None:
+                self.reset_flow()
+            for name in (SUPER_SOURCE, SUPER_SINK):
+                self._remove_node(name)
+            for node in wanted[0]:
+                self.add_edge(SUPER_SOURCE, node, self._total_capacity(node, outgoing=True))
+            for node in wanted[1]:
+                self.add_edge(node, SUPER_SINK, self._total_capacity(node, outgoing=False))
+            self.terminals = tuple(map(frozenset, wanted))
+            return source, sink
+        # same terminals: capacities may have changed through add_edge
+        for edges, outgoing in (([(SUPER_SOURCE, n) for n in wanted[0]], True),
+                                ([(n, SUPER_SINK) for n in wanted[1]], False)):
+            for u, v in edges:
+                total = self._total_capacity(v if outgoing else u, outgoing)
+                old = self.original_capacities[(u, v)]
+                if total > old:
+                    # only residual capacity is added; the solve finds the extra flow
+                    self.capacities[u][v] += total - old
+                    self.original_capacities[(u, v)] = total
+                elif total < old:
+                    self.update_capacity(u, v, total)
+        return source, sink
+
+    def _remove_node(self, node):
+        for other in self.neighbors.pop(node, ()):
+            self.neighbors[other].remove(node)
+            self.capacities[other].pop(node, None)
+            self.original_capacities.pop((node, other), None)
+            self.original_capacities.pop((other, node), None)
+            self.costs.pop((node, other), None)
+            self.costs.pop((other, node), None)
+        self.capacities.pop(node, None)
+
+    def reset_flow(self):
+        """Drops the current flow: residual capacities back to the original ones."""
+        for (u, v), cap in self.original_capacities.items():
+            self.capacities[u][v] = cap
+            self.capacities[v][u] = self.original_capacities.get((v, u), 0)
+        self.source = self.sink = None
+        self.flow_value = 0
+
+    def _total_capacity(self, node, outgoing):
+        original = self.original_capacities
+        if outgoing:
+            return sum(original.get((node, w), 0) for w in self.neighbors[node] if w != SUPER_SINK)
+        return sum(original.get((w, node), 0) for w in self.neighbors[node] if w != SUPER_SOURCE)
+
+    def min_cost_max_flow(self, source, sink):
+        """
+        Maximum flow of minimum total cost (edge costs from add_edge), by
+        successive shortest paths with Johnson potentials and Dijkstra on a
+        CSR snapshot. Solves from zero flow, replacing any current flow;
+        the residual capacities are left in self.capacities as with max_flow.
+        :return: dict with "max_flow", "total_cost" and "flows"
+                 ({(u, v): flow} for edges that carry flow)
+        """
+        edges = [(u, v, cap, self.costs.get((u, v), 0))
+                 for (u, v), cap in self.original_capacities.items() if u != v]
+        graph = CSRFlowNetwork.from_edges(edges, costs=True)
+        flow, cost = graph.min_cost_max_flow(source, sink)
+        # rebuild the residuals from the original capacities and the new flow
+        self.reset_flow()
+        flows = {}
+        for u, v, _, f in graph.edge_flows():
+            if f > 0:
+                self.capacities[u][v] -= f
+                self.capacities[v][u] += f
+                flows[(u, v)] = f
+        self.source, self.sink, self.flow_value = source, sink, flow
+        self.algorithm = self.algorithm or "edmonds_karp"
+        return {"max_flow": flow, "total_cost": cost, "flows": flows}
+
+    def update_capacity(self, u, v, new_cap):
+        """
+        Changes the capacity of edge u->v (adding it if missing) and repairs
+        the current flow instead of solving from scratch.
+        A raise only adds residual capacity and continues augmenting. A drop
+        below the flow on u->v cancels just the excess: it is rerouted from
+        u to v around the edge where possible, and the rest is pushed back
+        from u to the source and from the sink to v.
+        :return: the new maximum flow between the last solved source and sink
+        """
+        if self.source is None:
+            raise ValueError("No flow to update: call max_flow first")
+        if new_cap < 0:
+            raise ValueError("Capacity must be non-negative")
+        if v not in self.capacities[u]:
+            self.add_edge(u, v, 0)
+        # net flow on u->v
+        flow = self.original_capacities.get((u, v), 0) - self.capacities[u][v]
+        self.original_capacities[(u, v)] = new_cap
+        excess = flow - new_cap
+        if excess <= 0:
+            self.capacities[u][v] = new_cap - flow
+        else:
+            # leave exactly new_cap on u->v: u now holds `excess` extra units
+            # and v misses them
+            self.capacities[u][v] = 0
+            self.capacities[v][u] -= excess
+            excess -= self._augment(u, v, excess)
+            if excess > 0:
+                self._augment(u, self.source, excess)
+                self._augment(self.sink, v, excess)
+                self.flow_value -= excess
+        self._solve(self.source, self.sink, self.algorithm)
+        # internal terminal edges follow the node's total capacity, so they
+        # never become the bottleneck
+        for a, b, node, outgoing in ((SUPER_SOURCE, u, u, True), (v, SUPER_SINK, v, False)):
+            if node not in (SUPER_SOURCE, SUPER_SINK) and (a, b) in self.original_capacities:
+                total = self._total_capacity(node, outgoing)
+                if self.original_capacities[(a, b)] != total:
+                    self.update_capacity(a, b, total)
+        return self.flow_value
+
+    def decompose_flow(self):
+        """
+        Exact decomposition of the current flow into source->sink paths,
+        O(E * paths): walks edges that still carry flow, subtracts the path
+        bottleneck, and drops each exhausted edge once. Flow cycles met on
+        the way are cancelled, as they carry nothing from source to sink;
+        an edge into a node with no flow left out of it is dropped.
+        :return: list of (path, amount), path being the list of nodes
+        """
+        if self.source is None:
+            raise ValueError("No flow to decompose: call max_flow first")
+        source, sink = self.source, self.sink
+        flow = defaultdict(dict)
+        for (u, v), cap in self.original_capacities.items():
+            f = cap - self.capacities[u][v]
+            if f > 0 and u != v:
+                flow[u][v] = f
+        out = {u: list(row) for u, row in flow.items()}
+        paths = []
+        while True:
+            path = [source]
+            position = {source: 0}
+            while path[-1] != sink:
+                u = path[-1]
+                edges = out.get(u)
+                while edges and flow[u][edges[-1]] <= 0:
+                    edges.pop()
+                if not edges:
+                    if u == source:
+                        break
+                    # dead end (a rounding leftover with floats): drop u and
+                    # the edge into it, then go on from the previous node
+                    path.pop()
+                    del position[u]
+                    flow[path[-1]][u] = 0
+                    continue
+                v = edges[-1]
+                if v in position:
+                    # cancel the cycle v -> ... -> u -> v and resume at v
+                    cycle = path[position[v]:] + [v]
+                    amount = min(flow[a][b] for a, b in zip(cycle, cycle[1:]))
+                    for a, b in zip(cycle, cycle[1:]):
+                        flow[a][b] -= amount
+                    for w in path[position[v] + 1:]:
+                        del position[w]
+                    del path[position[v] + 1:]
+                    continue
+                position[v] = len(path)
+                path.append(v)
+            if path[-1] != sink:
+                return paths
+            amount = min(flow[a][b] for a, b in zip(path, path[1:]))
+            for a, b in zip(path, path[1:]):
+                flow[a][b] -= amount
+            paths.append((path, amount))
+
+    def edge_flows(self):
+        """(u, v, capacity, flow) for every added edge, flow being the net flow u->v (>= 0)."""
+        for (u, v), cap in self.original_capacities.items():
+            yield u, v, cap, max(cap - self.capacities[u][v], 0) if u != v else 0
+
+    def saturated_edges(self):
+        """
+        Edges whose flow equals their (positive) capacity: list of (u, v, capacity).
+        Internal SUPER_SOURCE/SUPER_SINK edges are left out.
+        """
+        return [(u, v, cap) for u, v, cap, flow in self.edge_flows()
+                if cap > 0 and flow == cap and u != SUPER_SOURCE and v != SUPER_SINK]
+
+    def min_cut(self):
+        """
+        Minimum cut of the current (maximum) flow, from one BFS over the
+        residual capacities: the source side is everything still reachable
+        from the source. Edges out of SUPER_SOURCE count as unbounded (they
+        never limit the flow), so the cut is made of real routes only.
+        :return: dict with "source_side", "sink_side" (sets of nodes),
+                 "cut_edges" (list of (u, v, capacity)) and "capacity"
+        """
+        if self.source is None:
+            raise ValueError("No flow to cut: call max_flow first")
+        reachable = {self.source}
+        queue = deque([self.source])
+        while queue:
+            u = queue.popleft()
+            for v in self.neighbors[u]:
+                if v not in reachable and (u == SUPER_SOURCE or self.capacities[u].get(v, 0) > 0):
+                    reachable.add(v)
+                    queue.append(v)
+        cut_edges = [(u, v, cap) for (u, v), cap in self.original_capacities.items()
+                     if cap > 0 and u in reachable and v not in reachable]
+        return {
+            "source_side": reachable,
+            "sink_side": set(self.neighbors) - reachable,
+            "cut_edges": cut_edges,
+            "capacity": sum(cap for _, _, cap in cut_edges),
+        }
+
+
+def _number(value):
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def read_edges_csv(path):
+    """
+    Lazily reads edges from a CSV file with a header row u,v,capacity and
+    an optional cost column.
+    :return: generator of (u, v, capacity) or (u, v, capacity, cost)
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = [name.strip() for name in next(reader)]
+        iu, iv, ic = header.index("u"), header.index("v"), header.index("capacity")
+        iw = header.index("cost") if "cost" in header else None
+        for row in reader:
+            if not row:
+                continue
+            if iw is None:
+                yield row[iu], row[iv], _number(row[ic])
+            else:
+                yield row[iu], row[iv], _number(row[ic]), _number(row[iw])
+
+
+def read_edges_jsonl(path):
+    """
+    Lazily reads edges from JSON Lines: one {"u": ..., "v": ..., "capacity": ...}
+    object (optionally with "cost") per line.
+    :return: generator of (u, v, capacity) or (u, v, capacity, cost)
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                edge = json.loads(line)
+                if "cost" in edge:
+                    yield edge["u"], edge["v"], edge["capacity"], edge["cost"]
+                else:
+                    yield edge["u"], edge["v"], edge["capacity"]
+
+
+def load_flow_network(path):
+    """Builds a FlowNetwork from a .csv or .jsonl edge list in one streaming pass."""
+    if path.endswith(".jsonl"):
+        return FlowNetwork.from_edges(read_edges_jsonl(path))
+    if path.endswith(".csv"):
+        return FlowNetwork.from_edges(read_edges_csv(path))
+    raise ValueError(f"Unsupported edge list format: {path}")
+
 
 if __name__ == "__main__":
     # --- Network Definition ---
-    net = FlowNetwork()
-    source, sink = 'source', 'sink'
-    
-    # Keep track of original capacities for the report
-    original_capacities = {}
-    def add_edge_and_track(u, v, w):
-        net.add_edge(u, v, w)
-        original_capacities[(u, v)] = w
-
-    # Define network structure using the helper
-    cap_T1 = 25 + 20 + 15
-    cap_T2 = 15 + 30 + 10
-    add_edge_and_track(source, 'T1', cap_T1)
-    add_edge_and_track(source, 'T2', cap_T2)
-    
-    add_edge_and_track('T1', 'S1', 25); add_edge_and_track('T1', 'S2', 20); add_edge_and_track('T1', 'S3', 15)
-    add_edge_and_track('T2', 'S3', 15); add_edge_and_track('T2', 'S4', 30); add_edge_and_track('T2', 'S2', 10)
-    
-    shop_caps = {
-        'M1': 15, 'M2': 10, 'M3': 20, 'M4': 15, 'M5': 10, 'M6': 25,
-        'M7': 20, 'M8': 15, 'M9': 10, 'M10': 20, 'M11': 10, 'M12': 15,
-        'M13': 5, 'M14': 10
-    }
-    add_edge_and_track('S1', 'M1', 15); add_edge_and_track('S1', 'M2', 10); add_edge_and_track('S1', 'M3', 20)
-    add_edge_and_track('S2', 'M4', 15); add_edge_and_track('S2', 'M5', 10); add_edge_and_track('S2', 'M6', 25)
-    add_edge_and_track('S3', 'M7', 20); add_edge_and_track('S3', 'M8', 15); add_edge_and_track('S3', 'M9', 10)
-    add_edge_and_track('S4', 'M10', 20); add_edge_and_track('S4', 'M11', 10); add_edge_and_track('S4', 'M12', 15)
-    add_edge_and_track('S4', 'M13', 5); add_edge_and_track('S4', 'M14', 10)
-
-    for m, cap in shop_caps.items():
-        add_edge_and_track(m, sink, cap)
+    # terminal -> warehouse and warehouse -> shop routes; a file with the
+    # same edges can be loaded instead: python solution.py edges.csv
+    edges = [
+        ('T1', 'S1', 25), ('T1', 'S2', 20), ('T1', 'S3', 15),
+        ('T2', 'S3', 15), ('T2', 'S4', 30), ('T2', 'S2', 10),
+        ('S1', 'M1', 15), ('S1', 'M2', 10), ('S1', 'M3', 20),
+        ('S2', 'M4', 15), ('S2', 'M5', 10), ('S2', 'M6', 25),
+        ('S3', 'M7', 20), ('S3', 'M8', 15), ('S3', 'M9', 10),
+        ('S4', 'M10', 20), ('S4', 'M11', 10), ('S4', 'M12', 15),
+        ('S4', 'M13', 5), ('S4', 'M14', 10),
+    ]
+    net = load_flow_network(sys.argv[1]) if len(sys.argv) > 1 else FlowNetwork.from_edges(edges)
+    terminals = sorted(n for n in net.neighbors if n.startswith('T'))
+    shops = sorted((n for n in net.neighbors if n.startswith('M')), key=lambda x: int(x[1:]))
 
     # --- Max Flow Calculation ---
-    max_flow = net.edmonds_karp(source, sink)
+    # terminals and shops are joined to an internal source and sink
+    max_flow = net.max_flow(terminals, shops)
+    source, sink = net.source, net.sink
+    original_capacities = net.original_capacities
     print(f"Maximum flow from terminals to shops: {max_flow}\n")
 
-    # --- Simplified Flow Report ---
+    # --- Flow Report ---
+    paths = net.decompose_flow()
+    shop_order = shops
+    # a path runs terminal -> ... -> shop, wrapped in the internal source/sink
+    # when there are several terminals or shops
+    flows = defaultdict(lambda: defaultdict(int))
+    for path, amount in paths:
+        route = path[1 if path[0] == SUPER_SOURCE else 0:-1 if path[-1] == SUPER_SINK else None]
+        term, shop = route[0], route[-1]
+        if term not in terminals or shop not in shops:
+            raise ValueError(f"Path {' -> '.join(map(str, path))} does not run from a terminal to a shop")
+        flows[term][shop] += amount
+    edge_flow = {(u, v): flow for u, v, _, flow in net.edge_flows()}
+
     print("Звіт: Розподіл потоків від терміналів до магазинів")
     print("-" * 50)
-    # This is a heuristic: trace flow back from shops to warehouses, then to terminals
-    flows = defaultdict(lambda: defaultdict(int))
-    for shop in sorted(shop_caps.keys(), key=lambda x: int(x[1:])):
-        for wh in ['S1', 'S2', 'S3', 'S4']:
-            flow_ws = net.capacities[shop].get(wh, 0)
-            if flow_ws > 0:
-                flow_t1_wh = net.capacities[wh].get('T1', 0)
-                flow_t2_wh = net.capacities[wh].get('T2', 0)
-                total_inflow = flow_t1_wh + flow_t2_wh
-                if total_inflow > 0:
-                    flows['Термінал 1'][shop] += flow_ws * (flow_t1_wh / total_inflow)
-                    flows['Термінал 2'][shop] += flow_ws * (flow_t2_wh / total_inflow)
-
-    for term in ['Термінал 1', 'Термінал 2']:
-        for shop in sorted(shop_caps.keys(), key=lambda x: int(x[1:])):
-            flow = flows[term][shop]
-            if flow > 0.1:
-                print(f"{term}\tМагазин {shop[1:]:<5}\t{int(round(flow))}")
+    for term in sorted(flows):
+        for shop in shop_order:
+            if flows[term][shop] > 0:
+                print(f"Термінал {term[1:]}\tМагазин {shop[1:]:<5}\t{flows[term][shop]}")
     print("-" * 50)
 
-    
-    
+    # --- Додатковий аналіз ---
+    # 2. Маршрути з найменшою пропускною здатністю і їх вплив на максимальний потік
+    routes = {(u, v): cap for (u, v), cap in original_capacities.items()
+              if u != SUPER_SOURCE and v != SUPER_SINK}
+    min_cap = min(routes.values())
+    routes_min = [f"{u}->{v} ({cap})" for (u, v), cap in routes.items() if cap == min_cap]
+    print(f"\n2. Маршрути з найменшою пропускною здатністю = {min_cap}")
+    print("Маршрути:", ", ".join(routes_min))
+    print("Ці маршрути можуть бути вузькими місцями та обмежувати загальний потік.")
+
+    # 3. Магазини з найменшим отриманим потоком
+    total_received = {shop: sum(flows[term][shop] for term in flows) for shop in shop_order}
+    min_recv = min(total_received.values())
+    shops_min = [shop for shop, val in total_received.items() if val == min_recv]
+    print(f"\n3. Магазини з найменшим отриманим потоком = {min_recv}")
+    print("Магазини:", ", ".join(shops_min))
+    for shop in shops_min:
+        edges_info = [f"{u}->{v} ({cap})" for (u, v), cap in routes.items() if v == shop]
+        print(f"Маршрути до {shop}:", ", ".join(edges_info))
+    print("Збільшення їх пропускної здатності може покращити постачання цих магазинів.")
+
+    # 4. Вузькі місця (сатуровані ребра)
+    bn_info = [f"{u}->{v} ({cap})" for u, v, cap in net.saturated_edges()]
+    print(f"\n4. Вузькі місця (сатуровані ребра): {', '.join(bn_info)}")
+
+    # 5. Мінімальний розріз: саме ці маршрути обмежують максимальний потік
+    cut = net.min_cut()
+    cut_info = [f"{u}->{v} ({cap})" for u, v, cap in cut["cut_edges"]]
+    print(f"\n5. Мінімальний розріз (пропускна здатність {cut['capacity']}): {', '.join(cut_info)}")
+
     # --- Enhanced Visualization ---
     try:
         import networkx as nx
@@ -128,8 +504,7 @@ if __name__ == "__main__":
 
         G = nx.DiGraph()
         for (u, v), cap in original_capacities.items():
-            flow = net.capacities[v].get(u, 0)
-            G.add_edge(u, v, capacity=cap, flow=flow)
+            G.add_edge(u, v, capacity=cap, flow=edge_flow[(u, v)])
 
         node_colors = {n: 'skyblue' for n in G.nodes()}
         for n in G.nodes():
@@ -164,31 +539,6 @@ if __name__ == "__main__":
                 edge_colors.append('black')
                 edge_styles.append('solid')
 
-        # --- Додатковий аналіз ---
-        # 2. Маршрути з найменшою пропускною здатністю і їх вплив на максимальний потік
-        min_cap = min(original_capacities.values())
-        routes_min = [f"{u}->{v} ({cap})" for (u, v), cap in original_capacities.items() if cap == min_cap]
-        print(f"\n2. Маршрути з найменшою пропускною здатністю = {min_cap}")
-        print("Маршрути:", ", ".join(routes_min))
-        print("Ці маршрути можуть бути вузькими місцями та обмежувати загальний потік.")
-
-        # 3. Магазини з найменшим отриманим потоком
-        total_received = {shop: flows['Термінал 1'][shop] + flows['Термінал 2'][shop] for shop in shop_caps}
-        min_recv = min(total_received.values())
-        shops_min = [shop for shop, val in total_received.items() if val == min_recv]
-        print(f"\n3. Магазини з найменшим отриманим потоком = {int(round(min_recv))}")
-        print("Магазини:", ", ".join(shops_min))
-        for shop in shops_min:
-            in_edges = [(u, v) for (u, v) in original_capacities if v == shop]
-            edges_info = [f"{u}->{v} ({original_capacities[(u, v)]})" for u, v in in_edges]
-            print(f"Маршрути до {shop}:", ", ".join(edges_info))
-        print("Збільшення їх пропускної здатності може покращити постачання цих магазинів.")
-
-        # 4. Вузькі місця (сатуровані ребра)
-        bottlenecks = [(u, v, data['capacity']) for u, v, data in G.edges(data=True) if data['flow'] == data['capacity']]
-        bn_info = [f"{u}->{v} ({cap})" for u, v, cap in bottlenecks]
-        print(f"\n4. Вузькі місця (сатуровані ребра): {', '.join(bn_info)}")
-
         plt.figure(figsize=(20, 24))
         
         for n in G.nodes():
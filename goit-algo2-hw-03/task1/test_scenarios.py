@@ -0,0 +1,57 @@
+import os
+import random
+import sys
+
+import pytest
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from scenarios import format_table, rank_upgrades
+from solution import FlowNetwork
+
+
+def random_network(seed, n=12, m=45, max_cap=20):
+    rng = random.Random(seed)
+    edges = {}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            edges[(u, v)] = rng.randint(0, max_cap)
+    return [(u, v, w) for (u, v), w in edges.items()]
+
+
+def fresh_flow(edges, changes, sources, sinks):
+    capacities = {(u, v): w for u, v, w in edges}
+    for (u, v), w in changes.items():
+        capacities[(u, v)] = w
+    net = FlowNetwork.from_edges((u, v, w) for (u, v), w in capacities.items())
+    return net.max_flow(sources, sinks)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("seed", range(3))
+def test_rank_upgrades_matches_fresh_solves(workers, seed):
+    edges = random_network(seed)
+    rng = random.Random(seed)
+    upgrades = [(u, v, rng.randint(-10, 15)) for u, v, _ in edges[:20]] + [(0, 11, 5)]
+    sources, sinks = [0, 1], [10, 11]
+    net = FlowNetwork.from_edges(edges)
+    table = rank_upgrades(net, sources, sinks, upgrades, workers=workers)
+    base = fresh_flow(edges, {}, sources, sinks)
+    assert net.flow_value == base
+    assert len(table) == len(upgrades)
+    assert [row["gain"] for row in table] == sorted((row["gain"] for row in table), reverse=True)
+    original = {(u, v): w for u, v, w in edges}
+    for row in table:
+        u, v = row["edge"]
+        assert row["capacity"] == max(original.get((u, v), 0) + row["delta"], 0)
+        assert row["max_flow"] == fresh_flow(edges, {(u, v): row["capacity"]}, sources, sinks)
+        assert row["gain"] == row["max_flow"] - base
+
+
+def test_rank_upgrades_leaves_base_network_solved():
+    net = FlowNetwork.from_edges([('s', 'a', 5), ('a', 't', 3), ('s', 't', 1)])
+    table = rank_upgrades(net, 's', 't', [('s', 'a', 5), ('a', 't', 4), ('s', 't', -1)], workers=1)
+    assert [(row["edge"], row["gain"]) for row in table] == [
+        (('a', 't'), 2), (('s', 'a'), 0), (('s', 't'), -1)]
+    assert net.flow_value == 4 and net.original_capacities[('a', 't')] == 3
+    assert net.min_cut()["capacity"] == 4
+    assert "a->t" in format_table(table, limit=1)
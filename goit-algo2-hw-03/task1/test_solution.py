@@ -0,0 +1,352 @@
+import os
+import random
+import sys
+
+import pytest
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from csr_network import CSRFlowNetwork
+from solution import FlowNetwork, SUPER_SINK, SUPER_SOURCE, load_flow_network
+
+ALGORITHMS = ["edmonds_karp", "dinic", "push_relabel"]
+
+
+def build(edges):
+    net = FlowNetwork()
+    for u, v, w in edges:
+        net.add_edge(u, v, w)
+    return net
+
+
+def random_edges(seed, n=12, m=45, max_cap=20):
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n), rng.randint(0, max_cap)) for _ in range(m)]
+    return [(u, v, w) for u, v, w in edges if u != v]
+
+
+CLRS_EDGES = [
+    ('s', 'v1', 16), ('s', 'v2', 13), ('v1', 'v3', 12), ('v2', 'v1', 4),
+    ('v2', 'v4', 14), ('v3', 'v2', 9), ('v3', 't', 20), ('v4', 'v3', 7), ('v4', 't', 4),
+]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_max_flow_clrs_example(algorithm):
+    assert build(CLRS_EDGES).max_flow('s', 't', algorithm=algorithm) == 23
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_algorithms_agree_and_leave_valid_flow(seed):
+    edges = random_edges(seed)
+    expected = build(edges).edmonds_karp(0, 11)
+    for algorithm in ("dinic", "push_relabel"):
+        original = build(edges)
+        net = build(edges)
+        flow = net.max_flow(0, 11, algorithm=algorithm)
+        assert flow == expected
+        for u in net.capacities:
+            balance = 0
+            for v, residual in net.capacities[u].items():
+                assert residual >= 0
+                balance += original.capacities[u][v] - residual
+            assert balance == {0: flow, 11: -flow}.get(u, 0)
+
+
+def test_max_flow_edge_cases():
+    net = build([('a', 'b', 5)])
+    assert net.max_flow('a', 'missing', algorithm="dinic") == 0
+    assert net.max_flow('b', 'a', algorithm="push_relabel") == 0
+    with pytest.raises(ValueError):
+        net.max_flow('a', 'b', algorithm="ford_fulkerson")
+
+
+def test_add_edge_neighbors_without_duplicates():
+    net = build([('a', 'b', 5), ('b', 'a', 3), ('a', 'b', 7)])
+    assert net.neighbors['a'] == ['b'] and net.neighbors['b'] == ['a']
+    assert net.capacities['a']['b'] == 7 and net.capacities['b']['a'] == 3
+
+
+def test_csr_from_edges_layout():
+    g = CSRFlowNetwork.from_edges([('s', 'a', 4), ('a', 't', 3), ('s', 'a', 2)])
+    assert g.nodes == ['s', 'a', 't'] and g.n == 3
+    assert list(g.offsets) == [0, 2, 5, 6]
+    assert g.cap.typecode == 'l'
+    for a in range(len(g.head)):
+        assert g.rev[g.rev[a]] == a
+        assert g.tail[g.rev[a]] == g.head[a]
+        assert g.offsets[g.tail[a]] <= a < g.offsets[g.tail[a] + 1]
+    assert g.max_flow('s', 't') == 3
+
+
+@pytest.mark.parametrize("algorithm", ["dinic", "push_relabel"])
+@pytest.mark.parametrize("seed", range(10))
+def test_csr_matches_dict_network(algorithm, seed):
+    # add_edge overwrites a repeated edge, from_edges keeps parallel arcs
+    edges = [(u, v, w) for (u, v), w in {(u, v): w for u, v, w in random_edges(seed)}.items()]
+    expected = build(edges).edmonds_karp(0, 11)
+    g = CSRFlowNetwork.from_edges(edges)
+    assert g.max_flow(0, 11, algorithm=algorithm) == expected
+    balance = {}
+    for u, v, cap, flow in g.edge_flows():
+        assert 0 <= flow <= cap
+        balance[u] = balance.get(u, 0) + flow
+        balance[v] = balance.get(v, 0) - flow
+    assert all(b == {0: expected, 11: -expected}.get(u, 0) for u, b in balance.items())
+    # residuals are kept: a second call finds no more flow, reset() starts over
+    assert g.max_flow(0, 11, algorithm=algorithm) == 0
+    g.reset()
+    assert g.max_flow(0, 11, algorithm=algorithm) == expected
+
+
+def test_csr_float_capacities_and_errors():
+    g = CSRFlowNetwork.from_edges([('s', 't', 1.5), ('s', 't', 2)])
+    assert g.cap.typecode == 'd'
+    assert g.max_flow('s', 't', algorithm="push_relabel") == 3.5
+    assert g.max_flow('s', 'missing') == 0
+    with pytest.raises(ValueError):
+        g.max_flow('s', 't', algorithm="edmonds_karp")
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("seed", range(20))
+def test_update_capacity_matches_fresh_solve(algorithm, seed):
+    edges = [(u, v, w) for (u, v), w in {(u, v): w for u, v, w in random_edges(seed)}.items()]
+    rng = random.Random(seed)
+    net = build(edges)
+    net.max_flow(0, 11, algorithm=algorithm)
+    current = dict(((u, v), w) for u, v, w in edges)
+    for _ in range(15):
+        if rng.random() < 0.2:
+            u, v = rng.sample(range(12), 2)
+        else:
+            u, v = rng.choice(list(current))
+        current[(u, v)] = rng.randint(0, 25)
+        flow = net.update_capacity(u, v, current[(u, v)])
+        fresh = build([(a, b, w) for (a, b), w in current.items()])
+        assert flow == fresh.edmonds_karp(0, 11) == net.flow_value
+        for a in net.capacities:
+            balance = 0
+            for b, residual in net.capacities[a].items():
+                assert residual >= 0
+                balance += net.original_capacities.get((a, b), 0) - residual
+            assert balance == {0: flow, 11: -flow}.get(a, 0)
+
+
+def test_update_capacity_cancels_only_excess():
+    net = build(CLRS_EDGES)
+    assert net.edmonds_karp('s', 't') == 23
+    # v4->t carries 4 units that cannot be rerouted
+    assert net.update_capacity('v4', 't', 1) == 20
+    assert net.update_capacity('v4', 't', 4) == 23
+    assert net.update_capacity('s', 'v1', 0) == 13
+    with pytest.raises(ValueError):
+        net.update_capacity('s', 'v1', -1)
+    with pytest.raises(ValueError):
+        FlowNetwork().update_capacity('a', 'b', 1)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("seed", range(20))
+def test_decompose_flow_paths_cover_the_flow(algorithm, seed):
+    edges = [(u, v, w) for (u, v), w in {(u, v): w for u, v, w in random_edges(seed)}.items()]
+    net = build(edges)
+    flow = net.max_flow(0, 11, algorithm=algorithm)
+    paths = net.decompose_flow()
+    assert sum(amount for _, amount in paths) == flow
+    used = {}
+    for path, amount in paths:
+        assert path[0] == 0 and path[-1] == 11 and amount > 0
+        assert len(set(path)) == len(path)
+        for u, v in zip(path, path[1:]):
+            used[(u, v)] = used.get((u, v), 0) + amount
+    for (u, v), amount in used.items():
+        assert amount <= net.original_capacities[(u, v)]
+
+
+def test_decompose_flow_float_capacities():
+    net = build([(0, 2, 0.3), (0, 1, 1.7), (1, 2, 0.3), (0, 2, 2.0)])
+    flow = net.max_flow(0, 2)
+    assert flow == pytest.approx(2.3)
+    paths = net.decompose_flow()
+    assert sum(amount for _, amount in paths) == pytest.approx(flow)
+    assert all(path[0] == 0 and path[-1] == 2 for path, _ in paths)
+
+
+def test_decompose_flow_cancels_cycles():
+    net = build([('s', 'a', 3), ('a', 't', 3), ('a', 'b', 2), ('b', 'c', 2), ('c', 'a', 2)])
+    assert net.edmonds_karp('s', 't') == 3
+    # add a circulation a -> b -> c -> a on top of the max flow
+    for u, v in (('a', 'b'), ('b', 'c'), ('c', 'a')):
+        net.capacities[u][v] -= 1
+        net.capacities[v][u] += 1
+    assert net.decompose_flow() == [(['s', 'a', 't'], 3)]
+    with pytest.raises(ValueError):
+        FlowNetwork().decompose_flow()
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("seed", range(20))
+def test_min_cut_capacity_equals_max_flow(algorithm, seed):
+    edges = [(u, v, w) for (u, v), w in {(u, v): w for u, v, w in random_edges(seed)}.items()]
+    net = build(edges)
+    flow = net.max_flow(0, 11, algorithm=algorithm)
+    cut = net.min_cut()
+    assert cut["capacity"] == flow
+    assert 0 in cut["source_side"]
+    assert cut["source_side"].isdisjoint(cut["sink_side"])
+    saturated = set(net.saturated_edges())
+    for u, v, cap in cut["cut_edges"]:
+        assert u in cut["source_side"] and v in cut["sink_side"]
+        assert (u, v, cap) in saturated
+    for u, v, cap, f in net.edge_flows():
+        assert 0 <= f <= cap
+
+
+def test_min_cut_clrs_example():
+    net = build(CLRS_EDGES)
+    net.edmonds_karp('s', 't')
+    cut = net.min_cut()
+    assert cut["source_side"] == {'s', 'v1', 'v2', 'v4'}
+    assert sorted(cut["cut_edges"]) == [('v1', 'v3', 12), ('v4', 't', 4), ('v4', 'v3', 7)]
+    assert ('v2', 'v1', 4) not in net.saturated_edges()
+    with pytest.raises(ValueError):
+        FlowNetwork().min_cut()
+
+
+def brute_force_min_cost(edges, s, t):
+    """Min cost of a max flow by cycle-canceling on the dict network (small graphs)."""
+    net = build([(u, v, w) for u, v, w, _ in edges])
+    flow = net.edmonds_karp(s, t)
+    cost = {(u, v): c for u, v, _, c in edges}
+    while True:
+        # Bellman-Ford over the residual graph, looking for a negative cycle
+        nodes = list(net.neighbors)
+        dist = {x: 0 for x in nodes}
+        parent = {}
+        last = None
+        for _ in range(len(nodes)):
+            last = None
+            for u in nodes:
+                for v, r in net.capacities[u].items():
+                    if r > 0:
+                        w = cost[(u, v)] if (u, v) in cost else -cost[(v, u)]
+                        if dist[u] + w < dist[v]:
+                            dist[v] = dist[u] + w
+                            parent[v] = u
+                            last = v
+        if last is None:
+            break
+        for _ in range(len(nodes)):
+            last = parent[last]
+        cycle = [last]
+        while parent[cycle[-1]] != last:
+            cycle.append(parent[cycle[-1]])
+        cycle.append(last)
+        arcs = [(cycle[i + 1], cycle[i]) for i in range(len(cycle) - 1)]
+        pushed = min(net.capacities[u][v] for u, v in arcs)
+        for u, v in arcs:
+            net.capacities[u][v] -= pushed
+            net.capacities[v][u] += pushed
+    total = sum(c * max(w - net.capacities[u][v], 0) for u, v, w, c in edges)
+    return flow, total
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_min_cost_max_flow_matches_cycle_canceling(seed):
+    rng = random.Random(seed)
+    pairs = {}
+    for u, v, w in random_edges(seed, n=8, m=24, max_cap=10):
+        if (v, u) not in pairs:
+            pairs[(u, v)] = w
+    edges = [(u, v, w, rng.randint(-3 if seed % 2 else 0, 9)) for (u, v), w in pairs.items()]
+    if seed % 2:
+        # negative costs only on edges leaving the source: no negative cycles
+        edges = [(u, v, w, c if u == 0 else abs(c)) for u, v, w, c in edges]
+    expected = brute_force_min_cost(edges, 0, 7)
+    net = FlowNetwork()
+    for u, v, w, c in edges:
+        net.add_edge(u, v, w, cost=c)
+    result = net.min_cost_max_flow(0, 7)
+    assert (result["max_flow"], result["total_cost"]) == expected
+    assert sum(c * result["flows"].get((u, v), 0) for u, v, _, c in edges) == expected[1]
+    assert net.flow_value == expected[0]
+    assert net.min_cut()["capacity"] == expected[0]
+
+
+def test_min_cost_max_flow_prefers_cheap_route_and_errors():
+    net = FlowNetwork()
+    net.add_edge('s', 'a', 5, cost=1)
+    net.add_edge('s', 'b', 5, cost=4)
+    net.add_edge('a', 't', 3, cost=1)
+    net.add_edge('b', 't', 5, cost=1)
+    net.add_edge('a', 'b', 5, cost=1)
+    result = net.min_cost_max_flow('s', 't')
+    assert result["max_flow"] == 8
+    # 3 via s-a-t (2 each), 2 via s-a-b-t (3 each), 3 via s-b-t (5 each)
+    assert result["total_cost"] == 6 + 6 + 15
+    assert result["flows"][('s', 'a')] == 5
+    g = CSRFlowNetwork.from_edges([('a', 'b', 1, -1), ('b', 'a', 1, -1)], costs=True)
+    with pytest.raises(ValueError):
+        g.min_cost_max_flow('a', 'b')
+    with pytest.raises(ValueError):
+        CSRFlowNetwork.from_edges([('a', 'b', 1)]).min_cost_max_flow('a', 'b')
+    assert g.min_cost_max_flow('a', 'missing') == (0, 0)
+
+
+def test_load_flow_network_csv_and_jsonl(tmp_path):
+    csv_path = tmp_path / "edges.csv"
+    csv_path.write_text("u,v,capacity,cost\n" + "".join(f"{u},{v},{w},1\n" for u, v, w in CLRS_EDGES))
+    jsonl_path = tmp_path / "edges.jsonl"
+    jsonl_path.write_text("".join(f'{{"u": "{u}", "v": "{v}", "capacity": {w}}}\n' for u, v, w in CLRS_EDGES))
+    for path in (csv_path, jsonl_path):
+        net = load_flow_network(str(path))
+        assert net.original_capacities == {(u, v): w for u, v, w in CLRS_EDGES}
+        assert net.max_flow('s', 't') == 23
+    assert load_flow_network(str(csv_path)).costs[('s', 'v1')] == 1
+    with pytest.raises(ValueError):
+        load_flow_network(str(tmp_path / "edges.txt"))
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("seed", range(10))
+def test_max_flow_multiple_sources_and_sinks(algorithm, seed):
+    edges = [(u, v, w) for (u, v), w in {(u, v): w for u, v, w in random_edges(seed)}.items()]
+    sources, sinks = [0, 1, 2], {9, 10, 11}
+    manual = build(edges + [('s', u, 10 ** 6) for u in sources] + [(v, 't', 10 ** 6) for v in sinks])
+    expected = manual.edmonds_karp('s', 't')
+    net = build(edges)
+    assert net.max_flow(sources, sinks, algorithm=algorithm) == expected
+    assert (net.source, net.sink) == (SUPER_SOURCE, SUPER_SINK)
+    cut = net.min_cut()
+    assert cut["capacity"] == expected
+    # internal edges never limit the flow, so they are neither cut nor reported
+    for u, v, _ in cut["cut_edges"] + net.saturated_edges():
+        assert u != SUPER_SOURCE and v != SUPER_SINK
+    assert sum(amount for _, amount in net.decompose_flow()) == expected
+    # the internal edges are kept: a repeated solve continues from the flow
+    assert net.max_flow(sources, sinks, algorithm=algorithm) == 0
+    assert net.flow_value == expected
+
+
+def test_max_flow_terminal_forms():
+    net = build([((0, 1), 'a', 3), ('a', 'b', 2)])
+    # a tuple is a node name, a one-element list is that node
+    assert net.max_flow((0, 1), ['b']) == 2
+    with pytest.raises(ValueError):
+        build(CLRS_EDGES).max_flow([SUPER_SOURCE, 's'], 't')
+
+
+def test_max_flow_rewires_changed_terminals():
+    edges = [('A', 'X', 5), ('B', 'X', 7), ('C', 'X', 3), ('X', 'T', 100)]
+    net = build(edges)
+    assert net.max_flow(['A', 'B'], 'T') == 12
+    assert net.max_flow(['A', 'C'], 'T') == 8
+    assert net.flow_value == 8
+    assert ('B' not in net.neighbors[SUPER_SOURCE])
+    assert net.max_flow('A', 'T') == 5
+    assert SUPER_SOURCE not in net.neighbors and ('A', 'X') in net.original_capacities
+    # same terminals: the internal edges follow later add_edge calls
+    net = build(edges)
+    assert net.max_flow(['A', 'B'], 'T') == 12
+    net.add_edge('A', 'T', 10)
+    assert net.max_flow(['A', 'B'], 'T') == 10
+    assert net.flow_value == 22
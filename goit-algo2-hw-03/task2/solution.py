@@ -1,6 +1,8 @@
 import csv
 import sys
 import timeit
+from array import array
+from bisect import bisect_left, bisect_right
 from BTrees.OOBTree import OOBTree
 
 
@@ -52,6 +54,30 @@ def range_query_dict(dct: dict, min_price: float, max_price: float) -> list[dict
     return result
 
 
+def build_sorted_index(items: list[dict]) -> tuple[array, array, list[dict]]:
+    """
+    Статичний індекс для каталогу лише для читання: товари, відсортовані за ціною,
+    та паралельні масиви унікальних цін і зсувів, з яких починається група кожної ціни
+    """
+    ordered = sorted(items, key=lambda item: item['Price'])
+    prices = array('d')
+    offsets = array('l')
+    for i, item in enumerate(ordered):
+        if not prices or item['Price'] != prices[-1]:
+            prices.append(item['Price'])
+            offsets.append(i)
+    offsets.append(len(ordered))
+    return prices, offsets, ordered
+
+
+def range_query_sorted(index: tuple[array, array, list[dict]], min_price: float, max_price: float) -> list[dict]:
+    """Два bisect по масиву цін і один зріз списку товарів: O(log n + k) без вузлів дерева"""
+    prices, offsets, ordered = index
+    lo = bisect_left(prices, min_price)
+    hi = bisect_right(prices, max_price)
+    return ordered[offsets[lo]:offsets[hi]]
+
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python solution.py <csv_file>")
@@ -66,6 +92,7 @@ if __name__ == "__main__":
     for item in items:
         add_item_to_tree(tree, item)
         add_item_to_dict(dct, item)
+    index = build_sorted_index(items)
 
     # Визначаємо межі запиту (від мін до макс по ціні)
     prices = [item['Price'] for item in items]
@@ -83,6 +110,12 @@ if __name__ == "__main__":
         globals=globals(),
         number=100
     )
+    sorted_time = timeit.timeit(
+        stmt='range_query_sorted(index, min_price, max_price)',
+        globals=globals(),
+        number=100
+    )
 
     print(f"Total range_query time for OOBTree: {tree_time:.6f} seconds")
     print(f"Total range_query time for Dict: {dict_time:.6f} seconds")
+    print(f"Total range_query time for sorted array + bisect: {sorted_time:.6f} seconds")
@@ -0,0 +1,60 @@
+import os
+import random
+import sys
+
+import pytest
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from BTrees.OOBTree import OOBTree
+from solution import (
+    add_item_to_dict,
+    add_item_to_tree,
+    build_sorted_index,
+    range_query_dict,
+    range_query_sorted,
+    range_query_tree,
+)
+
+
+def make_items(n, seed):
+    rng = random.Random(seed)
+    # few distinct prices, so most of them repeat
+    return [{'ID': str(i), 'Name': f"Item {i}", 'Category': rng.choice("ABC"),
+             'Price': rng.randint(1, 50) / 2}
+            for i in range(n)]
+
+
+def build(items):
+    tree = OOBTree()
+    dct = {}
+    for item in items:
+        add_item_to_tree(tree, item)
+        add_item_to_dict(dct, item)
+    return tree, dct, build_sorted_index(items)
+
+
+def ids(items):
+    return sorted(item['ID'] for item in items)
+
+
+@pytest.mark.parametrize("n", [0, 1, 200])
+def test_range_query_sorted_matches_tree_and_dict(n):
+    items = make_items(n, seed=n)
+    tree, dct, index = build(items)
+    rng = random.Random(n + 1)
+    bounds = [(rng.uniform(0, 26), rng.uniform(0, 26)) for _ in range(50)]
+    # equal bounds on an existing price, bounds outside the price range
+    bounds += [(10.0, 10.0), (-5, 0), (30, 40), (-5, 40), (25.0, 25.0), (0.5, 0.5)]
+    for min_price, max_price in bounds:
+        result = range_query_sorted(index, min_price, max_price)
+        assert result == range_query_tree(tree, min_price, max_price)
+        assert ids(result) == ids(range_query_dict(dct, min_price, max_price))
+
+
+def test_range_query_sorted_duplicates():
+    items = [{'ID': str(i), 'Name': "", 'Category': "", 'Price': price}
+             for i, price in enumerate([3.0, 1.0, 3.0, 2.0, 3.0])]
+    index = build_sorted_index(items)
+    assert [item['ID'] for item in range_query_sorted(index, 3.0, 3.0)] == ['0', '2', '4']
+    assert [item['ID'] for item in range_query_sorted(index, 1.5, 3.0)] == ['3', '0', '2', '4']
+    assert range_query_sorted(index, 3.5, 10) == []
+    assert range_query_sorted(index, 2.5, 2.0) == []